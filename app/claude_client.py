@@ -9,11 +9,36 @@ from __future__ import annotations
 import base64
 import os
 from dataclasses import dataclass
-from typing import Optional
+from typing import Final, Optional
 
-from anthropic import Anthropic
+from anthropic import AsyncAnthropic
 from PyQt6.QtCore import QObject, pyqtSignal
 
+_INTERVIEW_INSTRUCTION: Final[str] = """You are ME in a technical interview. You have access to my resume above. Speak as if YOU lived these experiences.
+
+CRITICAL: THIS IS A VERBAL INTERVIEW - I will be SPEAKING your response out loud.
+- NO CODE BLOCKS. Never. I cannot recite code verbally.
+- Explain concepts conversationally, like you're talking to the interviewer
+- For system design: describe components, data flow, trade-offs in plain English
+- A one-liner pseudocode reference is okay ("I'd use a dictionary mapping user IDs to timestamps")
+- Keep responses under 30 seconds of speaking time (~75-100 words)
+
+RESPONSE RULES:
+- First-person ONLY. Say "I built..." not "You could say..."
+- Lead with the answer. No preamble like "Great question!"
+- Be concise. Interviewers can ask follow-ups.
+
+FOR BEHAVIORAL QUESTIONS:
+- Use STAR format (Situation, Task, Action, Result) but keep it tight
+- Pull specific details from my resume: team sizes, technologies, metrics
+- If no exact match, bridge to closest related experience
+
+FOR TECHNICAL QUESTIONS I LACK EXPERIENCE IN:
+- Give a concise explanation showing I understand the concept
+- Bridge: "I haven't implemented X directly, but in my work on [related thing], I used similar principles..."
+
+TONE: Confident peer. No hedging like "I think maybe..." - speak with authority."""
+
 
 @dataclass(frozen=True)
 class ClaudeConfig:
@@ -33,8 +58,9 @@ class ClaudeStreamingClient(QObject):
         super().__init__()
         self._config = config or ClaudeConfig()
         self._api_key = os.getenv("ANTHROPIC_API_KEY", "")
-        self._client: Optional[Anthropic] = None
+        self._client: Optional[AsyncAnthropic] = None
         self._context = self._load_context()
+        self._system_prompt = self._build_system_prompt()
 
     def _load_context(self) -> str:
         try:
@@ -44,40 +70,16 @@ class ClaudeStreamingClient(QObject):
             return ""
 
     def _build_system_prompt(self) -> str:
-        base_instruction = """You are ME in a technical interview. You have access to my resume above. Speak as if YOU lived these experiences.
-
-CRITICAL: THIS IS A VERBAL INTERVIEW - I will be SPEAKING your response out loud.
-- NO CODE BLOCKS. Never. I cannot recite code verbally.
-- Explain concepts conversationally, like you're talking to the interviewer
-- For system design: describe components, data flow, trade-offs in plain English
-- A one-liner pseudocode reference is okay ("I'd use a dictionary mapping user IDs to timestamps")
-- Keep responses under 30 seconds of speaking time (~75-100 words)
-
-RESPONSE RULES:
-- First-person ONLY. Say "I built..." not "You could say..."
-- Lead with the answer. No preamble like "Great question!"
-- Be concise. Interviewers can ask follow-ups.
-
-FOR BEHAVIORAL QUESTIONS:
-- Use STAR format (Situation, Task, Action, Result) but keep it tight
-- Pull specific details from my resume: team sizes, technologies, metrics
-- If no exact match, bridge to closest related experience
-
-FOR TECHNICAL QUESTIONS I LACK EXPERIENCE IN:
-- Give a concise explanation showing I understand the concept
-- Bridge: "I haven't implemented X directly, but in my work on [related thing], I used similar principles..."
-
-TONE: Confident peer. No hedging like "I think maybe..." - speak with authority."""
         if self._context:
-            return f"{self._context}\n\n---\n\n{base_instruction}"
-        return base_instruction
+            return f"{self._context}\n\n---\n\n{_INTERVIEW_INSTRUCTION}"
+        return _INTERVIEW_INSTRUCTION
 
     def _ensure_client(self) -> bool:
         if not self._api_key:
             self.error_occurred.emit("ANTHROPIC_API_KEY not set")
             return False
         if not self._client:
-            self._client = Anthropic(api_key=self._api_key)
+            self._client = AsyncAnthropic(api_key=self._api_key)
         return True
 
     async def stream_response(
@@ -102,14 +104,14 @@ TONE: Confident peer. No hedging like "I think maybe..." - speak with authority.
             conversation.append({"role": "user", "content": question})
 
             full_response = ""
-            with self._client.messages.stream(
+            async with self._client.messages.stream(
                 model=self._config.model,
                 max_tokens=self._config.max_tokens,
                 temperature=self._config.temperature,
-                system=self._build_system_prompt(),
+                system=self._system_prompt,
                 messages=conversation,
             ) as stream:
-                for text in stream.text_stream:
+                async for text in stream.text_stream:
                     full_response += text
                     self.text_chunk.emit(text)
 
@@ -128,7 +130,7 @@ TONE: Confident peer. No hedging like "I think maybe..." - speak with authority.
             with open(image_path, "rb") as f:
                 image_data = base64.standard_b64encode(f.read()).decode("utf-8")
 
-            with self._client.messages.stream(
+            async with self._client.messages.stream(
                 model=self._config.model,
                 max_tokens=self._config.max_tokens,
                 temperature=self._config.temperature,
@@ -150,7 +152,7 @@ TONE: Confident peer. No hedging like "I think maybe..." - speak with authority.
                     ],
                 }],
             ) as stream:
-                for text in stream.text_stream:
+                async for text in stream.text_stream:
                     self.text_chunk.emit(text)
 
             self.response_complete.emit()
@@ -1,92 +1,89 @@
 from datetime import datetime
 from typing import Callable, Optional
-import threading
 import time
 import os
 
-import win32clipboard
-import win32con
-from PIL import ImageGrab
+from PyQt6.QtGui import QClipboard, QImage
+from PyQt6.QtWidgets import QApplication
 
 from contracts import ClipboardPayload, PayloadType
 
 
 class ClipboardMonitor:
+    """Reports clipboard changes from Qt's dataChanged notification.
+
+    Qt listens for the OS clipboard-change event itself, so there is no
+    polling thread; the callback runs on the GUI thread.
+    """
+
     def __init__(self, on_change: Callable[[ClipboardPayload], None]):
         self._on_change = on_change
         self._last_text: Optional[str] = None
         self._last_image_hash: Optional[int] = None
-        self._running = False
-        self._thread: Optional[threading.Thread] = None
+        self._clipboard: Optional[QClipboard] = None
         self._temp_dir = os.path.join(os.path.expanduser("~"), ".cliphelper_temp")
         os.makedirs(self._temp_dir, exist_ok=True)
 
-    def _get_clipboard_text(self) -> Optional[str]:
-        try:
-            win32clipboard.OpenClipboard()
-            try:
-                if win32clipboard.IsClipboardFormatAvailable(win32clipboard.CF_UNICODETEXT):
-                    data = win32clipboard.GetClipboardData(win32clipboard.CF_UNICODETEXT)
-                    return data
-            finally:
-                win32clipboard.CloseClipboard()
-        except Exception:
-            pass
-        return None
+    @staticmethod
+    def _image_hash(image: QImage) -> int:
+        return hash(image.constBits().asstring(image.sizeInBytes()))
 
-    def _get_clipboard_image(self) -> Optional[tuple]:
-        try:
-            img = ImageGrab.grabclipboard()
-            if img is not None and hasattr(img, 'save'):
-                return (img, hash(img.tobytes()))
-        except Exception:
-            pass
-        return None
+    def _prime(self) -> None:
+        mime = self._clipboard.mimeData()
+        if mime is None:
+            return
+        if mime.hasImage():
+            image = self._clipboard.image()
+            if not image.isNull():
+                self._last_image_hash = self._image_hash(image)
+        if mime.hasText():
+            self._last_text = mime.text()
 
-    def _poll_loop(self):
-        self._last_text = self._get_clipboard_text()
-        image_result = self._get_clipboard_image()
-        if image_result:
-            self._last_image_hash = image_result[1]
-        while self._running:
-            time.sleep(0.1)
+    def _on_data_changed(self) -> None:
+        mime = self._clipboard.mimeData()
+        if mime is None:
+            return
 
-            image_result = self._get_clipboard_image()
-            if image_result:
-                img, img_hash = image_result
+        if mime.hasImage():
+            image = self._clipboard.image()
+            if not image.isNull():
+                img_hash = self._image_hash(image)
                 if img_hash != self._last_image_hash:
                     self._last_image_hash = img_hash
                     path = os.path.join(self._temp_dir, f"snip_{int(time.time())}.png")
-                    img.save(path, "PNG")
+                    image.save(path, "PNG")
                     payload = ClipboardPayload(
                         content=path,
                         payload_type=PayloadType.IMAGE,
                         timestamp=datetime.now()
                     )
                     self._on_change(payload)
-                    continue
+                    return
 
-            current_text = self._get_clipboard_text()
-            if current_text and current_text != self._last_text:
-                self._last_text = current_text
-                payload = ClipboardPayload(
-                    content=current_text.strip(),
-                    payload_type=PayloadType.TEXT,
-                    timestamp=datetime.now()
-                )
-                self._on_change(payload)
+        current_text = mime.text() if mime.hasText() else None
+        if current_text and current_text != self._last_text:
+            self._last_text = current_text
+            payload = ClipboardPayload(
+                content=current_text.strip(),
+                payload_type=PayloadType.TEXT,
+                timestamp=datetime.now()
+            )
+            self._on_change(payload)
 
     def start(self):
-        if self._running:
+        if self._clipboard is not None:
             return
-        self._running = True
-        self._thread = threading.Thread(target=self._poll_loop, daemon=True)
-        self._thread.start()
+        self._clipboard = QApplication.clipboard()
+        self._prime()
+        self._clipboard.dataChanged.connect(self._on_data_changed)
 
     def stop(self):
-        self._running = False
-        if self._thread:
-            self._thread.join(timeout=1)
+        if self._clipboard is not None:
+            try:
+                self._clipboard.dataChanged.disconnect(self._on_data_changed)
+            except TypeError:
+                pass
+            self._clipboard = None
         try:
             for f in os.listdir(self._temp_dir):
                 os.remove(os.path.join(self._temp_dir, f))
@@ -35,6 +35,7 @@ class DeepgramStreamingClient(QObject):
         self._config = config or DeepgramConfig()
         self._api_key = os.getenv("DEEPGRAM_API_KEY", "")
         self._audio_queue: asyncio.Queue[bytes] = asyncio.Queue()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._pyaudio: Optional[pyaudio.PyAudio] = None
         self._stream: Optional[pyaudio.Stream] = None
         self._websocket: Optional[websockets.WebSocketClientProtocol] = None
@@ -55,6 +56,15 @@ class DeepgramStreamingClient(QObject):
         ]
         return f"wss://api.deepgram.com/v1/listen?{'&'.join(params)}"
 
+    async def _connect(self) -> websockets.WebSocketClientProtocol:
+        # Audio is raw linear16 and replies are small JSON, so permessage-deflate
+        # only adds buffering and CPU on both ends.
+        return await websockets.connect(
+            self._build_url(),
+            additional_headers={"Authorization": f"Token {self._api_key}"},
+            compression=None,
+        )
+
     def _audio_callback(
         self,
         in_data: Optional[bytes],
@@ -62,8 +72,9 @@ class DeepgramStreamingClient(QObject):
         time_info: dict,
         status: int,
     ) -> tuple[None, int]:
-        if in_data and self._running:
-            self._audio_queue.put_nowait(in_data)
+        # PortAudio calls this on its own thread; asyncio.Queue is not thread-safe.
+        if in_data and self._running and self._loop is not None:
+            self._loop.call_soon_threadsafe(self._audio_queue.put_nowait, in_data)
         return (None, pyaudio.paContinue)
 
     def _start_audio(self) -> None:
@@ -138,6 +149,7 @@ class DeepgramStreamingClient(QObject):
 
         self._running = True
         self._accumulated_transcript = ""
+        self._loop = asyncio.get_running_loop()
 
         while not self._audio_queue.empty():
             try:
@@ -145,11 +157,8 @@ class DeepgramStreamingClient(QObject):
             except asyncio.QueueEmpty:
                 break
 
-        url = self._build_url()
-        headers = {"Authorization": f"Token {self._api_key}"}
-
         try:
-            self._websocket = await websockets.connect(url, additional_headers=headers)
+            self._websocket = await self._connect()
             self._start_audio()
 
             sender_task = asyncio.create_task(self._sender(self._websocket))
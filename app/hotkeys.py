@@ -0,0 +1,87 @@
+"""Global hotkeys registered with Win32 RegisterHotKey."""
+from __future__ import annotations
+
+import ctypes
+import ctypes.wintypes
+import logging
+from typing import Callable
+
+from PyQt6.QtCore import QAbstractNativeEventFilter, QCoreApplication
+
+logger = logging.getLogger(__name__)
+
+MOD_NOREPEAT = 0x4000
+WM_HOTKEY = 0x0312
+
+VK_ESCAPE = 0x1B
+VK_F8 = 0x77
+VK_F9 = 0x78
+VK_F10 = 0x79
+
+_WINDOWS_MSG = b"windows_generic_MSG"
+
+
+class HotkeyFilter(QAbstractNativeEventFilter):
+    """Owns the hotkey registrations and picks WM_HOTKEY out of Qt's message pump.
+
+    Hotkeys registered without a window are posted to the registering
+    thread's queue. Registering from the GUI thread means Qt's event
+    dispatcher already drains them, so callbacks run on the GUI thread
+    without a listener thread or a cross-thread hop.
+    """
+
+    def __init__(
+        self,
+        callbacks: dict[int, Callable[[], None]],
+        enabled: set[int] | None = None,
+    ) -> None:
+        super().__init__()
+        self._callbacks = callbacks
+        self._initial = set(callbacks) if enabled is None else set(enabled)
+        self._registered: set[int] = set()
+
+    def install(self) -> None:
+        QCoreApplication.instance().installNativeEventFilter(self)
+        for vk in self._initial:
+            self._register(vk)
+
+    def remove(self) -> None:
+        for vk in list(self._registered):
+            self._unregister(vk)
+        QCoreApplication.instance().removeNativeEventFilter(self)
+
+    def set_enabled(self, vk: int, enabled: bool) -> None:
+        if enabled:
+            self._register(vk)
+        else:
+            self._unregister(vk)
+
+    def nativeEventFilter(self, event_type, message) -> tuple[bool, int]:
+        if event_type != _WINDOWS_MSG or not message:
+            return False, 0
+        msg = ctypes.wintypes.MSG.from_address(int(message))
+        if msg.message != WM_HOTKEY:
+            return False, 0
+        callback = self._callbacks.get(msg.wParam)
+        if callback is None:
+            return False, 0
+        # An exception escaping a Qt virtual aborts the process under PyQt6.
+        try:
+            callback()
+        except Exception:
+            logger.exception("Hotkey callback failed")
+        return True, 0
+
+    def _register(self, vk: int) -> None:
+        if vk in self._registered:
+            return
+        # The virtual-key code doubles as the hotkey id.
+        if ctypes.windll.user32.RegisterHotKey(None, vk, MOD_NOREPEAT, vk):
+            self._registered.add(vk)
+        else:
+            logger.warning("Failed to register hotkey 0x%02X", vk)
+
+    def _unregister(self, vk: int) -> None:
+        if vk in self._registered:
+            ctypes.windll.user32.UnregisterHotKey(None, vk)
+            self._registered.discard(vk)
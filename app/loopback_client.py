@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import json
+import logging
 import multiprocessing
 import os
 import time
@@ -15,6 +16,11 @@ from PyQt6.QtCore import QObject, QTimer, pyqtSignal
 
 from app.loopback_worker import MessageType, WorkerConfig, run_capture_loop
 
+logger = logging.getLogger(__name__)
+
+_KEEPALIVE_MESSAGE = json.dumps({"type": "KeepAlive"})
+_KEEPALIVE_INTERVAL_S = 8.0
+
 
 @dataclass(frozen=True)
 class LoopbackConfig:
@@ -22,6 +28,7 @@ class LoopbackConfig:
     target_sample_rate: int = 16000
     channels: int = 1
     chunk_duration: float = 0.05
+    max_send_duration: float = 0.2
     encoding: str = "linear16"
     model: str = "nova-3"
     language: str = "en"
@@ -52,11 +59,16 @@ class LoopbackStreamingClient(QObject):
         self._queue_reader_task: Optional[asyncio.Task[None]] = None
         self._chunks_received = 0
         self._chunks_sent = 0
+        self._max_send_bytes = (
+            int(self._config.target_sample_rate * self._config.max_send_duration)
+            * 2 * self._config.channels
+        )
         self._is_warmed = False
         self._is_capturing = False
         self._sender_task: Optional[asyncio.Task[None]] = None
         self._receiver_task: Optional[asyncio.Task[None]] = None
         self._keepalive_task: Optional[asyncio.Task[None]] = None
+        self._session_task: Optional[asyncio.Task[None]] = None
         self._last_final_time: float = 0.0
         self._silence_timer: Optional[QTimer] = None
         self._silence_threshold_ms: int = 1000
@@ -65,7 +77,7 @@ class LoopbackStreamingClient(QObject):
     def set_silence_threshold(self, default_ms: int, question_ms: int = 500) -> None:
         self._silence_threshold_ms = default_ms
         self._question_silence_threshold_ms = question_ms
-        print(f"[DEBUG] Silence thresholds set: default={default_ms}ms, question={question_ms}ms")
+        logger.debug("Silence thresholds set: default=%dms, question=%dms", default_ms, question_ms)
 
     def _start_silence_monitor(self) -> None:
         if self._silence_timer is None:
@@ -73,12 +85,12 @@ class LoopbackStreamingClient(QObject):
             self._silence_timer.timeout.connect(self._check_silence)
         self._last_final_time = time.time()
         self._silence_timer.start(200)
-        print("[DEBUG] Silence monitor started")
+        logger.debug("Silence monitor started")
 
     def _stop_silence_monitor(self) -> None:
         if self._silence_timer is not None:
             self._silence_timer.stop()
-            print("[DEBUG] Silence monitor stopped")
+            logger.debug("Silence monitor stopped")
 
     def _check_silence(self) -> None:
         if not self._is_capturing:
@@ -94,7 +106,7 @@ class LoopbackStreamingClient(QObject):
         elapsed_ms = (time.time() - self._last_final_time) * 1000
         if elapsed_ms >= threshold:
             q_indicator = " (question detected!)" if is_question else ""
-            print(f"[DEBUG] Silence detected! {elapsed_ms:.0f}ms >= {threshold}ms threshold{q_indicator}")
+            logger.debug("Silence detected! %.0fms >= %dms threshold%s", elapsed_ms, threshold, q_indicator)
             self._stop_silence_monitor()
             self.silence_detected.emit()
 
@@ -103,10 +115,10 @@ class LoopbackStreamingClient(QObject):
             return True
 
         if not self._api_key:
-            print("[DEBUG] Cannot warm up: DEEPGRAM_API_KEY not set")
+            logger.warning("Cannot warm up: DEEPGRAM_API_KEY not set")
             return False
 
-        print("[DEBUG] Warming up loopback client...")
+        logger.debug("Warming up loopback client...")
 
         self._output_queue = multiprocessing.Queue()
         self._input_queue = multiprocessing.Queue()
@@ -123,21 +135,18 @@ class LoopbackStreamingClient(QObject):
             daemon=True,
         )
         self._process.start()
-        print(f"[DEBUG] Subprocess started with PID: {self._process.pid}")
+        logger.debug("Subprocess started with PID: %s", self._process.pid)
 
         ready = await self._wait_for_ready()
         if not ready:
             self._terminate_process()
             return False
 
-        url = self._build_url()
-        headers = {"Authorization": f"Token {self._api_key}"}
-
         try:
-            self._websocket = await websockets.connect(url, additional_headers=headers)
-            print("[DEBUG] WebSocket connected to Deepgram (pre-warmed)")
+            self._websocket = await self._connect()
+            logger.debug("WebSocket connected to Deepgram (pre-warmed)")
         except Exception as e:
-            print(f"[DEBUG] WebSocket connection failed during warm-up: {e}")
+            logger.warning("WebSocket connection failed during warm-up: %s", e)
             self._terminate_process()
             return False
 
@@ -148,7 +157,7 @@ class LoopbackStreamingClient(QObject):
 
         self._is_warmed = True
         self._keepalive_task = asyncio.create_task(self._keepalive_loop())
-        print("[DEBUG] Loopback client warmed up and ready!")
+        logger.debug("Loopback client warmed up and ready!")
         return True
 
     def _terminate_process(self) -> None:
@@ -173,13 +182,22 @@ class LoopbackStreamingClient(QObject):
         ]
         return f"wss://api.deepgram.com/v1/listen?{'&'.join(params)}"
 
+    async def _connect(self) -> websockets.WebSocketClientProtocol:
+        # Audio is raw linear16 and replies are small JSON, so permessage-deflate
+        # only adds buffering and CPU on both ends.
+        return await websockets.connect(
+            self._build_url(),
+            additional_headers={"Authorization": f"Token {self._api_key}"},
+            compression=None,
+        )
+
     async def _ensure_websocket_connected(self) -> bool:
         ws_open = (self._websocket.state == WebSocketState.OPEN) if self._websocket is not None else None
-        print(f"[DEBUG] _ensure_websocket_connected() called, websocket={self._websocket is not None}, open={ws_open}")
+        logger.debug("_ensure_websocket_connected() called, websocket=%s, open=%s", self._websocket is not None, ws_open)
         if self._websocket is not None and self._websocket.state == WebSocketState.OPEN:
             return True
 
-        print("[DEBUG] WebSocket stale or closed, reconnecting...")
+        logger.debug("WebSocket stale or closed, reconnecting...")
 
         if self._websocket is not None:
             try:
@@ -195,25 +213,22 @@ class LoopbackStreamingClient(QObject):
                 try:
                     await task
                 except (asyncio.CancelledError, Exception) as e:
-                    print(f"[DEBUG] Task cleanup: {type(e).__name__}")
+                    logger.debug("Task cleanup: %s", type(e).__name__)
 
         self._sender_task = None
         self._receiver_task = None
 
-        url = self._build_url()
-        headers = {"Authorization": f"Token {self._api_key}"}
-
         try:
-            self._websocket = await websockets.connect(url, additional_headers=headers)
+            self._websocket = await self._connect()
             if self._websocket.state != WebSocketState.OPEN:
-                print("[DEBUG] WebSocket connected but not in OPEN state")
+                logger.warning("WebSocket connected but not in OPEN state")
                 return False
-            print("[DEBUG] WebSocket reconnected to Deepgram")
+            logger.debug("WebSocket reconnected to Deepgram")
             self._sender_task = asyncio.create_task(self._sender(self._websocket))
             self._receiver_task = asyncio.create_task(self._receiver(self._websocket))
             return True
         except Exception as e:
-            print(f"[DEBUG] WebSocket reconnection failed: {e}")
+            logger.warning("WebSocket reconnection failed: %s", e)
             self.error_occurred.emit(f"Failed to reconnect: {e}")
             return False
 
@@ -221,11 +236,13 @@ class LoopbackStreamingClient(QObject):
         while self._running and self._is_warmed and not self._is_capturing:
             try:
                 if self._websocket is not None and self._websocket.state == WebSocketState.OPEN:
-                    await self._websocket.send(b'')
-                    print("[DEBUG] Keepalive ping sent")
-                await asyncio.sleep(15)
+                    # An empty binary frame means CloseStream to Deepgram; KeepAlive
+                    # has to be a text message, sent within its 10 s idle timeout.
+                    await self._websocket.send(_KEEPALIVE_MESSAGE)
+                    logger.debug("Keepalive ping sent")
+                await asyncio.sleep(_KEEPALIVE_INTERVAL_S)
             except Exception as e:
-                print(f"[DEBUG] Keepalive error: {e}")
+                logger.warning("Keepalive error: %s", e)
                 break
 
     def _blocking_queue_get(
@@ -242,7 +259,7 @@ class LoopbackStreamingClient(QObject):
         if self._output_queue is None:
             return
 
-        print("[DEBUG] Queue reader started")
+        logger.debug("Queue reader started")
         loop = asyncio.get_running_loop()
 
         while self._running:
@@ -255,7 +272,7 @@ class LoopbackStreamingClient(QObject):
 
             if message is None:
                 if self._process is not None and not self._process.is_alive():
-                    print("[DEBUG] Subprocess crashed!")
+                    logger.warning("Subprocess crashed!")
                     self.error_occurred.emit("Capture subprocess crashed")
                     self._running = False
                     break
@@ -266,40 +283,46 @@ class LoopbackStreamingClient(QObject):
             if msg_type == "audio":
                 self._chunks_received += 1
                 if self._chunks_received == 1:
-                    print("[DEBUG] First audio chunk received from subprocess!")
+                    logger.debug("First audio chunk received from subprocess!")
                 elif self._chunks_received % 50 == 0:
-                    print(f"[DEBUG] Received {self._chunks_received} chunks from subprocess")
+                    logger.debug("Received %d chunks from subprocess", self._chunks_received)
                 await self._audio_queue.put(payload)
             elif msg_type == "error":
-                print(f"[DEBUG] Subprocess error: {payload}")
+                logger.warning("Subprocess error: %s", payload)
                 self.error_occurred.emit(payload)
                 self._running = False
                 break
             elif msg_type == "debug":
-                print(f"[SUBPROCESS] {payload}")
+                logger.debug("Subprocess: %s", payload)
 
     async def _sender(self, ws: websockets.WebSocketClientProtocol) -> None:
-        print("[DEBUG] Sender task started")
+        logger.debug("Sender task started")
         try:
             while self._running:
                 try:
                     data = await asyncio.wait_for(self._audio_queue.get(), timeout=0.1)
+                    if not self._audio_queue.empty():
+                        # Chunks that piled up during the last send go out as one frame.
+                        batch = bytearray(data)
+                        while len(batch) < self._max_send_bytes and not self._audio_queue.empty():
+                            batch += self._audio_queue.get_nowait()
+                        data = bytes(batch)
                     self._chunks_sent += 1
                     if self._chunks_sent == 1:
-                        print("[DEBUG] First audio chunk sent to Deepgram!")
+                        logger.debug("First audio chunk sent to Deepgram!")
                     elif self._chunks_sent % 50 == 0:
-                        print(f"[DEBUG] Sent {self._chunks_sent} chunks to Deepgram")
+                        logger.debug("Sent %d chunks to Deepgram", self._chunks_sent)
                     await ws.send(data)
                 except asyncio.TimeoutError:
                     continue
         except websockets.exceptions.ConnectionClosed:
-            print("[DEBUG] WebSocket connection closed in sender")
+            logger.debug("WebSocket connection closed in sender")
         except Exception as e:
-            print(f"[DEBUG] Sender error: {e}")
+            logger.warning("Sender error: %s", e)
             self.error_occurred.emit(f"Sender error: {e}")
 
     async def _receiver(self, ws: websockets.WebSocketClientProtocol) -> None:
-        print("[DEBUG] Receiver task started")
+        logger.debug("Receiver task started")
         msg_count = 0
         try:
             async for msg in ws:
@@ -309,11 +332,11 @@ class LoopbackStreamingClient(QObject):
                 data = json.loads(msg)
 
                 if msg_count == 1:
-                    print("[DEBUG] First Deepgram message received!")
+                    logger.debug("First Deepgram message received!")
                 
                 # Debug: show first few messages and any with transcripts
                 if msg_count <= 3:
-                    print(f"[DEBUG] Deepgram msg {msg_count}: {str(data)[:300]}")
+                    logger.debug("Deepgram msg %d: %.300s", msg_count, data)
 
                 if "channel" in data:
                     alternatives = data["channel"].get("alternatives", [])
@@ -338,7 +361,7 @@ class LoopbackStreamingClient(QObject):
         if self._output_queue is None:
             return False
 
-        print("[DEBUG] Waiting for subprocess ready signal...")
+        logger.debug("Waiting for subprocess ready signal...")
         loop = asyncio.get_running_loop()
         start = loop.time()
 
@@ -352,43 +375,43 @@ class LoopbackStreamingClient(QObject):
 
             if message is None:
                 if self._process is not None and not self._process.is_alive():
-                    print("[DEBUG] Subprocess died while waiting for ready")
+                    logger.warning("Subprocess died while waiting for ready")
                     return False
                 continue
 
             msg_type, payload = message
 
             if msg_type == "ready":
-                print("[DEBUG] Ready signal received!")
+                logger.debug("Ready signal received!")
                 return True
             elif msg_type == "error":
-                print(f"[DEBUG] Error during init: {payload}")
+                logger.warning("Error during init: %s", payload)
                 self.error_occurred.emit(payload)
                 return False
             elif msg_type == "debug":
-                print(f"[SUBPROCESS] {payload}")
+                logger.debug("Subprocess: %s", payload)
 
-        print("[DEBUG] Timeout waiting for ready signal")
+        logger.warning("Timeout waiting for ready signal")
         return False
 
     async def start_streaming(self) -> None:
-        print(f"[DEBUG] start_streaming() called, is_warmed={self._is_warmed}")
+        logger.debug("start_streaming() called, is_warmed=%s", self._is_warmed)
         if not self._is_warmed:
-            print("[DEBUG] Not warmed, falling back to cold start")
+            logger.debug("Not warmed, falling back to cold start")
             await self._cold_start_streaming()
             return
 
         try:
-            print("[DEBUG] About to call _ensure_websocket_connected()")
+            logger.debug("About to call _ensure_websocket_connected()")
             connected = await self._ensure_websocket_connected()
-            print(f"[DEBUG] _ensure_websocket_connected() returned {connected}")
+            logger.debug("_ensure_websocket_connected() returned %s", connected)
             if not connected:
-                print("[DEBUG] Could not establish WebSocket, falling back to cold start")
+                logger.debug("Could not establish WebSocket, falling back to cold start")
                 self._is_warmed = False
                 await self._cold_start_streaming()
                 return
         except Exception as e:
-            print(f"[DEBUG] Exception in _ensure_websocket_connected: {type(e).__name__}: {e}")
+            logger.warning("Exception in _ensure_websocket_connected: %s: %s", type(e).__name__, e)
             self._is_warmed = False
             await self._cold_start_streaming()
             return
@@ -396,7 +419,7 @@ class LoopbackStreamingClient(QObject):
         if self._keepalive_task is not None:
             self._keepalive_task.cancel()
             self._keepalive_task = None
-        print("[DEBUG] Starting capture (pre-warmed, instant)")
+        logger.debug("Starting capture (pre-warmed, instant)")
         self._accumulated_transcript = ""
         self._is_capturing = True
         self._chunks_received = 0
@@ -410,7 +433,7 @@ class LoopbackStreamingClient(QObject):
 
         if self._input_queue is not None:
             self._input_queue.put("resume")
-            print("[DEBUG] Resume signal sent to subprocess")
+            logger.debug("Resume signal sent to subprocess")
         self._start_silence_monitor()
 
     async def _cold_start_streaming(self) -> None:
@@ -444,7 +467,7 @@ class LoopbackStreamingClient(QObject):
             daemon=True,
         )
         self._process.start()
-        print(f"[DEBUG] Subprocess started with PID: {self._process.pid}")
+        logger.debug("Subprocess started with PID: %s", self._process.pid)
 
         ready = await self._wait_for_ready()
         if not ready:
@@ -457,25 +480,34 @@ class LoopbackStreamingClient(QObject):
         if self._input_queue is not None:
             self._input_queue.put("resume")
 
-        url = self._build_url()
-        headers = {"Authorization": f"Token {self._api_key}"}
-
         try:
-            self._websocket = await websockets.connect(url, additional_headers=headers)
-            print("[DEBUG] WebSocket connected to Deepgram")
-
-            self._queue_reader_task = asyncio.create_task(self._queue_reader())
-            self._sender_task = asyncio.create_task(self._sender(self._websocket))
-            self._receiver_task = asyncio.create_task(self._receiver(self._websocket))
-            self._start_silence_monitor()
-
-            await asyncio.gather(self._sender_task, self._receiver_task, self._queue_reader_task)
-
+            self._websocket = await self._connect()
+            logger.debug("WebSocket connected to Deepgram")
         except websockets.exceptions.InvalidStatus as e:
             error_msg = f"Connection failed: {e}"
             if hasattr(e, 'response') and e.response.status_code == 401:
                 error_msg = "Invalid Deepgram API key"
             self.error_occurred.emit(error_msg)
+            self._stop_capture()
+            self._running = False
+            return
+        except Exception as e:
+            self.error_occurred.emit(f"Streaming error: {e}")
+            self._stop_capture()
+            self._running = False
+            return
+
+        self._queue_reader_task = asyncio.create_task(self._queue_reader())
+        self._sender_task = asyncio.create_task(self._sender(self._websocket))
+        self._receiver_task = asyncio.create_task(self._receiver(self._websocket))
+        self._start_silence_monitor()
+        # Return once streaming is set up so a queued stop_streaming can run;
+        # the session task owns the teardown when the stream ends.
+        self._session_task = asyncio.create_task(self._run_cold_session())
+
+    async def _run_cold_session(self) -> None:
+        try:
+            await asyncio.gather(self._sender_task, self._receiver_task, self._queue_reader_task)
         except Exception as e:
             self.error_occurred.emit(f"Streaming error: {e}")
         finally:
@@ -492,7 +524,7 @@ class LoopbackStreamingClient(QObject):
 
     async def stop_streaming(self) -> None:
         self._stop_silence_monitor()
-        print("[DEBUG] Pausing capture")
+        logger.debug("Pausing capture")
         self._is_capturing = False
 
         if self._is_warmed and self._keepalive_task is None:
@@ -500,16 +532,22 @@ class LoopbackStreamingClient(QObject):
 
         if self._input_queue is not None:
             self._input_queue.put("pause")
-            print("[DEBUG] Pause signal sent to subprocess")
+            logger.debug("Pause signal sent to subprocess")
 
     async def shutdown(self) -> None:
         self._stop_silence_monitor()
-        print("[DEBUG] Shutting down loopback client")
+        logger.debug("Shutting down loopback client")
         self._running = False
         self._is_warmed = False
         self._is_capturing = False
 
-        for task in [self._queue_reader_task, self._sender_task, self._receiver_task, self._keepalive_task]:
+        for task in [
+            self._queue_reader_task,
+            self._sender_task,
+            self._receiver_task,
+            self._keepalive_task,
+            self._session_task,
+        ]:
             if task is not None:
                 task.cancel()
                 try:
@@ -521,6 +559,7 @@ class LoopbackStreamingClient(QObject):
         self._sender_task = None
         self._receiver_task = None
         self._keepalive_task = None
+        self._session_task = None
 
         if self._input_queue is not None:
             try:
@@ -537,7 +576,12 @@ class LoopbackStreamingClient(QObject):
                 pass
             self._websocket = None
 
-        print("[DEBUG] Loopback client shutdown complete")
+        logger.debug("Loopback client shutdown complete")
+
+    @property
+    def has_transcript(self) -> bool:
+        # Only non-blank finals are appended, so any content means speech.
+        return bool(self._accumulated_transcript)
 
     def get_transcript(self) -> str:
         return self._accumulated_transcript.strip()
@@ -20,13 +20,21 @@ class OCRResult:
     error: Optional[str] = None
 
 
+def _load_image(image_path: Path) -> Image.Image:
+    image = Image.open(image_path)
+    image.load()
+    return image
+
+
 class WindowsOCR:
     def __init__(self, language: str = "en"):
         self._language = language
 
     async def _extract_async(self, image_path: Path) -> OCRResult:
         try:
-            image = Image.open(image_path)
+            # Decoding is the only CPU-heavy step; recognition itself is a WinRT
+            # async operation and can be awaited on any running loop.
+            image = await asyncio.to_thread(_load_image, image_path)
             result = await winocr.recognize_pil(image, lang=self._language)
             
             if result and result.text:
@@ -39,7 +47,7 @@ class WindowsOCR:
         except Exception as e:
             return OCRResult(text="", success=False, error=str(e))
 
-    def extract_text(self, image_path: str) -> OCRResult:
+    async def extract_text_async(self, image_path: str) -> OCRResult:
         if not WINOCR_AVAILABLE:
             return OCRResult(text="", success=False, error=f"winocr not available: {WINOCR_ERROR}")
 
@@ -48,10 +56,13 @@ class WindowsOCR:
         if not path.exists():
             return OCRResult(text="", success=False, error=f"Image not found: {image_path}")
 
+        return await self._extract_async(path)
+
+    def extract_text(self, image_path: str) -> OCRResult:
         loop = asyncio.new_event_loop()
         try:
             asyncio.set_event_loop(loop)
-            return loop.run_until_complete(self._extract_async(path))
+            return loop.run_until_complete(self.extract_text_async(image_path))
         except Exception as e:
             return OCRResult(text="", success=False, error=str(e))
         finally:
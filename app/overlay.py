@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import functools
+import logging
 import re
 
 import pyperclip
@@ -7,12 +9,14 @@ import pyperclip
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTextEdit, QApplication, QSizeGrip
 )
-from PyQt6.QtCore import Qt, QTimer, QPoint, pyqtSignal
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt, QTimer, QPoint, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QFont, QTextCursor, QTextDocument
 
 from config import Config
 from app.stealth import make_stealth
 
+logger = logging.getLogger(__name__)
+
 # Dark theme constants (VS Code/PyCharm style)
 THEME_BACKGROUND = "#1e1e1e"
 THEME_TEXT = "#d4d4d4"
@@ -25,6 +29,94 @@ THEME_ERROR = "#ff6b6b"
 FONT_FAMILY = "'JetBrains Mono', 'Consolas', 'Courier New', monospace"
 FONT_SIZE_PT = 11
 
+_MONO_FAMILIES = ["JetBrains Mono", "Consolas", "Courier New"]
+
+_HEADER_BUTTON_STYLE = """
+    QPushButton {
+        background-color: transparent;
+        color: #666666;
+        border: none;
+        font-size: 14px;
+    }
+    QPushButton:hover {
+        color: #ffffff;
+    }
+"""
+
+_LABEL_STYLE = f"""
+    QLabel {{
+        color: {THEME_TEXT_MUTED};
+        background-color: transparent;
+        padding: 4px;
+    }}
+"""
+
+_INTERIM_LABEL_STYLE = f"""
+    QLabel {{
+        color: {THEME_TEXT_MUTED};
+        background-color: transparent;
+        font-style: italic;
+        padding: 4px;
+    }}
+"""
+
+_TEXT_EDIT_STYLE = f"""
+    QTextEdit {{
+        background-color: {THEME_BACKGROUND};
+        color: {THEME_TEXT};
+        font-family: {FONT_FAMILY};
+        font-size: {FONT_SIZE_PT}pt;
+        border: 1px solid {THEME_BORDER};
+        padding: 8px;
+        selection-background-color: {THEME_SELECTION};
+    }}
+    QScrollBar:vertical {{
+        background-color: {THEME_BORDER};
+        width: 6px;
+        border-radius: 3px;
+    }}
+    QScrollBar::handle:vertical {{
+        background-color: rgba(150, 150, 150, 150);
+        border-radius: 3px;
+        min-height: 20px;
+    }}
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
+        height: 0px;
+    }}
+"""
+
+
+_CODE_BLOCK_RE = re.compile(r"```(\w*)\n(.*?)```", re.DOTALL)
+_INLINE_CODE_RE = re.compile(r"`([^`]+)`")
+_MD_TRIGGER_CHARS = frozenset("`\n*_")
+
+_PRE_TEMPLATE = (
+    f'<pre style="font-family: {FONT_FAMILY}; '
+    f'background-color: {THEME_CODE_BACKGROUND}; padding: 10px; margin: 8px 0; '
+    f'border-radius: 6px; white-space: pre-wrap; word-wrap: break-word; '
+    f'color: {THEME_CODE_TEXT}; font-size: {FONT_SIZE_PT - 1}pt; '
+    f'line-height: 1.4;">'
+    f'<code>{{code}}</code></pre>'
+)
+_CODE_TEMPLATE = (
+    f'<code style="font-family: {FONT_FAMILY}; '
+    f'background-color: rgba(0, 0, 0, 0.2); padding: 2px 4px; '
+    f'border-radius: 3px; color: {THEME_CODE_TEXT};">\\1</code>'
+)
+
+
+def _escape_html(s: str) -> str:
+    return s.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+@functools.cache
+def _mono_font(point_size: int) -> QFont:
+    """Return the shared monospace font for a point size (built on first use)."""
+    font = QFont()
+    font.setFamilies(_MONO_FAMILIES)
+    font.setPointSize(point_size)
+    return font
+
 
 class StealthOverlay(QWidget):
     interim_transcript = pyqtSignal(str)
@@ -33,9 +125,14 @@ class StealthOverlay(QWidget):
     def __init__(self, config: Config) -> None:
         super().__init__()
         self._config = config
-        self._drag_pos: QPoint | None = None
+        self._drag_start_global: QPoint | None = None
+        self._drag_start_pos: QPoint | None = None
         self._resize_edge: str | None = None
         self._response_text = ""
+        self._in_code_fence = False
+        self._can_fast_append = False
+        self._stealth_applied = False
+        self._last_size: tuple[int, int] = (0, 0)
         self._setup_ui()
         self._setup_timer()
         self._connect_signals()
@@ -45,55 +142,34 @@ class StealthOverlay(QWidget):
         self.text_chunk_received.connect(self._append_text)
 
     def _markdown_to_html(self, text: str) -> str:
-        def escape_html(s: str) -> str:
-            return s.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-
-        code_block_pattern = re.compile(r"```(\w*)\n(.*?)```", re.DOTALL)
         parts: list[str] = []
         last_end = 0
 
-        for match in code_block_pattern.finditer(text):
+        for match in _CODE_BLOCK_RE.finditer(text):
             before = text[last_end:match.start()]
-            if before.strip():
+            if before and not before.isspace():
                 parts.append(self._process_inline_text(before))
 
-            code_content = escape_html(match.group(2).rstrip())
-            parts.append(
-                f'<pre style="font-family: {FONT_FAMILY}; '
-                f'background-color: {THEME_CODE_BACKGROUND}; padding: 10px; margin: 8px 0; '
-                f'border-radius: 6px; white-space: pre-wrap; word-wrap: break-word; '
-                f'color: {THEME_CODE_TEXT}; font-size: {FONT_SIZE_PT - 1}pt; '
-                f'line-height: 1.4;">'
-                f'<code>{code_content}</code></pre>'
-            )
+            code_content = _escape_html(match.group(2).rstrip())
+            parts.append(_PRE_TEMPLATE.format(code=code_content))
             last_end = match.end()
 
         remaining = text[last_end:]
-        if remaining.strip():
+        if remaining and not remaining.isspace():
             parts.append(self._process_inline_text(remaining))
 
         return "".join(parts)
 
     def _process_inline_text(self, text: str) -> str:
-        def escape_html(s: str) -> str:
-            return s.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-
-        inline_code_pattern = re.compile(r"`([^`]+)`")
-        paragraphs = text.strip().split("\n\n")
         result: list[str] = []
 
-        for para in paragraphs:
+        for para in text.strip().split("\n\n"):
             para = para.strip()
             if not para:
                 continue
 
-            escaped = escape_html(para)
-            processed = inline_code_pattern.sub(
-                f'<code style="font-family: {FONT_FAMILY}; '
-                f'background-color: rgba(0, 0, 0, 0.2); padding: 2px 4px; '
-                f'border-radius: 3px; color: {THEME_CODE_TEXT};">\\1</code>',
-                escaped
-            )
+            escaped = _escape_html(para)
+            processed = _INLINE_CODE_RE.sub(_CODE_TEMPLATE, escaped)
             lines = processed.replace("\n", "<br>")
             result.append(f"<p>{lines}</p>")
 
@@ -126,28 +202,16 @@ class StealthOverlay(QWidget):
         header_layout.setContentsMargins(0, 0, 0, 0)
         header_layout.addStretch()
 
-        header_btn_style = """
-            QPushButton {
-                background-color: transparent;
-                color: #666666;
-                border: none;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                color: #ffffff;
-            }
-        """
-
         self._copy_btn = QPushButton("[C]")
         self._copy_btn.setFixedSize(24, 20)
-        self._copy_btn.setStyleSheet(header_btn_style)
+        self._copy_btn.setStyleSheet(_HEADER_BUTTON_STYLE)
         self._copy_btn.setToolTip("Copy to clipboard")
         self._copy_btn.clicked.connect(self._copy_to_clipboard)
         header_layout.addWidget(self._copy_btn)
 
         self._dismiss_btn = QPushButton("×")
         self._dismiss_btn.setFixedSize(20, 20)
-        self._dismiss_btn.setStyleSheet(header_btn_style)
+        self._dismiss_btn.setStyleSheet(_HEADER_BUTTON_STYLE)
         self._dismiss_btn.clicked.connect(self.hide)
         header_layout.addWidget(self._dismiss_btn)
 
@@ -155,34 +219,15 @@ class StealthOverlay(QWidget):
 
         self._transcript_label = QLabel()
         self._transcript_label.setWordWrap(True)
-        self._transcript_label.setStyleSheet(f"""
-            QLabel {{
-                color: {THEME_TEXT_MUTED};
-                background-color: transparent;
-                padding: 4px;
-            }}
-        """)
-        transcript_font = QFont()
-        transcript_font.setFamilies(["JetBrains Mono", "Consolas", "Courier New"])
-        transcript_font.setPointSize(FONT_SIZE_PT - 1)
-        self._transcript_label.setFont(transcript_font)
+        self._transcript_label.setStyleSheet(_LABEL_STYLE)
+        self._transcript_label.setFont(_mono_font(FONT_SIZE_PT - 1))
         self._transcript_label.hide()
         container_layout.addWidget(self._transcript_label)
 
         self._interim_label = QLabel()
         self._interim_label.setWordWrap(True)
-        self._interim_label.setStyleSheet(f"""
-            QLabel {{
-                color: {THEME_TEXT_MUTED};
-                background-color: transparent;
-                font-style: italic;
-                padding: 4px;
-            }}
-        """)
-        font = QFont()
-        font.setFamilies(["JetBrains Mono", "Consolas", "Courier New"])
-        font.setPointSize(FONT_SIZE_PT - 1)
-        self._interim_label.setFont(font)
+        self._interim_label.setStyleSheet(_INTERIM_LABEL_STYLE)
+        self._interim_label.setFont(_mono_font(FONT_SIZE_PT - 1))
         self._interim_label.hide()
         container_layout.addWidget(self._interim_label)
 
@@ -195,50 +240,20 @@ class StealthOverlay(QWidget):
         )
         self._text_edit.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self._text_edit.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self._text_edit.setStyleSheet(f"""
-            QTextEdit {{
-                background-color: {THEME_BACKGROUND};
-                color: {THEME_TEXT};
-                font-family: {FONT_FAMILY};
-                font-size: {FONT_SIZE_PT}pt;
-                border: 1px solid {THEME_BORDER};
-                padding: 8px;
-                selection-background-color: {THEME_SELECTION};
-            }}
-            QScrollBar:vertical {{
-                background-color: {THEME_BORDER};
-                width: 6px;
-                border-radius: 3px;
-            }}
-            QScrollBar::handle:vertical {{
-                background-color: rgba(150, 150, 150, 150);
-                border-radius: 3px;
-                min-height: 20px;
-            }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                height: 0px;
-            }}
-        """)
-        font = QFont()
-        font.setFamilies(["JetBrains Mono", "Consolas", "Courier New"])
-        font.setPointSize(FONT_SIZE_PT)
-        self._text_edit.setFont(font)
+        self._text_edit.setStyleSheet(_TEXT_EDIT_STYLE)
+        self._text_edit.setFont(_mono_font(FONT_SIZE_PT))
+        # Back buffer for streamed renders; parented to the overlay so that
+        # QTextEdit.setDocument never deletes the document it swaps out.
+        self._text_edit.document().setParent(self)
+        self._back_doc = QTextDocument(self)
+        self._back_doc.setDefaultFont(_mono_font(FONT_SIZE_PT))
 
         container_layout.addWidget(self._text_edit)
 
         self._cheatsheet_label = QLabel("F8 Text  |  F9 Record  |  F10 Retry  |  Esc Cancel")
         self._cheatsheet_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self._cheatsheet_label.setStyleSheet(f"""
-            QLabel {{
-                color: {THEME_TEXT_MUTED};
-                background-color: transparent;
-                padding: 4px;
-            }}
-        """)
-        cheatsheet_font = QFont()
-        cheatsheet_font.setFamilies(["JetBrains Mono", "Consolas", "Courier New"])
-        cheatsheet_font.setPointSize(FONT_SIZE_PT - 2)
-        self._cheatsheet_label.setFont(cheatsheet_font)
+        self._cheatsheet_label.setStyleSheet(_LABEL_STYLE)
+        self._cheatsheet_label.setFont(_mono_font(FONT_SIZE_PT - 2))
         container_layout.addWidget(self._cheatsheet_label)
 
         main_layout = QVBoxLayout(self)
@@ -253,6 +268,7 @@ class StealthOverlay(QWidget):
         self._hide_timer.timeout.connect(self.hide)
         self._hide_timer.setSingleShot(True)
 
+    @pyqtSlot(str)
     def _show_interim(self, text: str) -> None:
         self._interim_label.setText(f'"{text}"')
         self._interim_label.show()
@@ -261,54 +277,102 @@ class StealthOverlay(QWidget):
         self._transcript_label.setText(text)
         self._transcript_label.show()
 
+    @pyqtSlot()
     def _copy_to_clipboard(self) -> None:
         """Copy response text to system clipboard."""
         text = self._response_text or self._text_edit.toPlainText()
+        logger.debug("Copy clicked, text length: %d", len(text))
         if text:
             try:
                 pyperclip.copy(text)
             except Exception:
+                logger.debug("pyperclip copy failed, falling back to QClipboard", exc_info=True)
                 clipboard = QApplication.clipboard()
                 clipboard.setText(text)
                 QApplication.processEvents()
 
+    @pyqtSlot(str)
     def _append_text(self, text: str) -> None:
         self._response_text += text
-        self._text_edit.setHtml(self._markdown_to_html(self._response_text))
+        if self._can_fast_append and _MD_TRIGGER_CHARS.isdisjoint(text):
+            # Plain words after plain words render identically, so extend
+            # the last paragraph in place instead of re-rendering everything.
+            cursor = QTextCursor(self._text_edit.document())
+            cursor.movePosition(QTextCursor.MoveOperation.End)
+            cursor.insertText(text)
+        else:
+            self._render_response()
         scrollbar = self._text_edit.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
 
+    def _render_response(self) -> None:
+        text = self._response_text
+        self._in_code_fence = text.count("```") % 2 == 1
+        self._can_fast_append = (
+            not self._in_code_fence
+            and bool(text)
+            and text[-1] not in _MD_TRIGGER_CHARS
+            and not text[-1].isspace()
+        )
+        doc = self._back_doc
+        doc.setHtml(self._markdown_to_html(text))
+        self._back_doc = self._text_edit.document()
+        self._text_edit.setDocument(doc)
+
     def clear_and_show(self) -> None:
         self._response_text = ""
+        self._can_fast_append = False
         self._text_edit.setHtml("")
         self._interim_label.setText("")
         self._interim_label.show()
-        self._position_top_center()
-        self.resize(self._config.overlay_width, 400)
-        self.show()
-        make_stealth(self)
+        self._present()
+
+    @property
+    def response_text(self) -> str:
+        """The full text of the current (or last) streamed response."""
+        return self._response_text
 
     def start_streaming_response(self) -> None:
         self._interim_label.hide()
         self._response_text = ""
+        self._can_fast_append = False
         self._text_edit.setHtml("<p>Thinking...</p>")
 
     def show_response(self, text: str) -> None:
         self._interim_label.hide()
         self._response_text = text
+        self._can_fast_append = False
         self._text_edit.setHtml(self._markdown_to_html(text))
-        self._position_top_center()
-        self.resize(self._config.overlay_width, 400)
-        self.show()
-        make_stealth(self)
+        self._present()
         if self._config.overlay_timeout_ms > 0:
             self._hide_timer.start(self._config.overlay_timeout_ms)
 
     def show_error(self, error: str) -> None:
         self._interim_label.hide()
         self._response_text = f"[Error: {error}]"
+        self._can_fast_append = False
         self._text_edit.setHtml(f'<p style="color: {THEME_ERROR};">{self._response_text}</p>')
 
+    def _present(self) -> None:
+        """Show the overlay, touching geometry and stealth only when needed."""
+        size = (self._config.overlay_width, 400)
+        if self._last_size != size:
+            self.resize(*size)
+            self._last_size = size
+        if not self.isVisible():
+            self._position_top_center()
+            self.show()
+        if not self._stealth_applied:
+            self._stealth_applied = make_stealth(self)
+
+    def hideEvent(self, event) -> None:
+        super().hideEvent(event)
+        self._stealth_applied = False
+        # A size dragged with the grip only lasts until the overlay closes.
+        self._last_size = (0, 0)
+        # Esc or the dismiss button may hide us first; don't leave a pending timeout.
+        self._hide_timer.stop()
+
     def resizeEvent(self, event) -> None:
         super().resizeEvent(event)
         self._size_grip.move(self.width() - 16, self.height() - 16)
@@ -331,16 +395,19 @@ class StealthOverlay(QWidget):
             if text_edit_rect.contains(container_pos):
                 self._text_edit.setFocus()
                 return
-            self._drag_pos = event.globalPosition().toPoint() - self.frameGeometry().topLeft()
+            self._drag_start_global = event.globalPosition().toPoint()
+            self._drag_start_pos = self.pos()
             event.accept()
 
     def mouseMoveEvent(self, event) -> None:
-        if self._drag_pos and event.buttons() == Qt.MouseButton.LeftButton:
-            self.move(event.globalPosition().toPoint() - self._drag_pos)
+        if self._drag_start_global is not None and event.buttons() == Qt.MouseButton.LeftButton:
+            delta = event.globalPosition().toPoint() - self._drag_start_global
+            self.move(self._drag_start_pos + delta)
             event.accept()
 
     def mouseReleaseEvent(self, event) -> None:
-        self._drag_pos = None
+        self._drag_start_global = None
+        self._drag_start_pos = None
 
     def enterEvent(self, event) -> None:
         self._hide_timer.stop()
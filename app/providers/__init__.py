@@ -2,6 +2,13 @@
 
 from .base import BaseProvider
 from .claude_provider import ClaudeProvider
-from .gemini_provider import GeminiProvider
 
 __all__ = ["BaseProvider", "ClaudeProvider", "GeminiProvider"]
+
+
+def __getattr__(name: str):
+    # Importing google-genai is slow, so GeminiProvider is only loaded on first access.
+    if name == "GeminiProvider":
+        from .gemini_provider import GeminiProvider
+        return GeminiProvider
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from abc import abstractmethod
+from typing import Iterable
 
 from PyQt6.QtCore import QObject, pyqtSignal
 
@@ -28,11 +29,18 @@ class BaseProvider(QObject):
         """Initialize the base provider."""
         super().__init__()
 
+    def reset_history_cache(self) -> None:
+        """Drop any state derived from previous conversation history.
+
+        Called when the session history is cleared. The default
+        implementation keeps no such state.
+        """
+
     @abstractmethod
     async def stream_response(
         self,
         transcript: str,
-        messages: list[dict[str, str]] | None,
+        messages: Iterable[dict[str, str]] | None,
         system_prompt: str,
     ) -> str:
         """Stream a response from the AI provider.
@@ -5,7 +5,7 @@ from __future__ import annotations
 import logging
 import os
 from dataclasses import dataclass
-from typing import Optional
+from typing import Iterable, Optional
 
 from anthropic import AsyncAnthropic
 
@@ -80,7 +80,7 @@ class ClaudeProvider(BaseProvider):
     async def stream_response(
         self,
         transcript: str,
-        messages: list[dict[str, str]] | None,
+        messages: Iterable[dict[str, str]] | None,
         system_prompt: str,
     ) -> str:
         """Stream a response from Claude.
@@ -97,8 +97,7 @@ class ClaudeProvider(BaseProvider):
             return ""
 
         try:
-            conversation = messages.copy() if messages else []
-            conversation.append({"role": "user", "content": transcript})
+            conversation = [*(messages or ()), {"role": "user", "content": transcript}]
 
             full_response = ""
             async with self._client.messages.stream(
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import itertools
 import logging
 import os
-from typing import Optional
+from typing import Iterable, Optional
 
 from google import genai
 from google.genai import types
@@ -38,6 +39,7 @@ class GeminiProvider(BaseProvider):
         self._model = model
         self._api_key = os.getenv(self.ENV_API_KEY, "")
         self._client: Optional[genai.Client] = None
+        self._history_contents: list[types.Content] = []
 
         if not self._api_key:
             logger.error("GEMINI_API_KEY not set in environment")
@@ -55,13 +57,20 @@ class GeminiProvider(BaseProvider):
             self._client = genai.Client()
         return True
 
+    def reset_history_cache(self) -> None:
+        """Discard converted history so the next request rebuilds it."""
+        self._history_contents.clear()
+
     def _convert_messages_to_contents(
         self,
         transcript: str,
-        messages: list[dict[str, str]] | None,
+        messages: Iterable[dict[str, str]] | None,
     ) -> list[types.Content]:
         """Convert message history to Gemini Content format.
 
+        Session history only grows between clears, so messages converted
+        on earlier turns are cached and only the new suffix is converted.
+
         Args:
             transcript: The current user input.
             messages: Optional conversation history.
@@ -69,31 +78,28 @@ class GeminiProvider(BaseProvider):
         Returns:
             List of Content objects for Gemini API.
         """
-        contents: list[types.Content] = []
-
-        if messages:
-            for msg in messages:
-                role = "user" if msg["role"] == "user" else "model"
-                contents.append(
-                    types.Content(
-                        role=role,
-                        parts=[types.Part.from_text(msg["content"])],
-                    )
+        user_content = types.Content(
+            role="user",
+            parts=[types.Part.from_text(transcript)],
+        )
+        if messages is None:
+            return [user_content]
+
+        for msg in itertools.islice(messages, len(self._history_contents), None):
+            role = "user" if msg["role"] == "user" else "model"
+            self._history_contents.append(
+                types.Content(
+                    role=role,
+                    parts=[types.Part.from_text(msg["content"])],
                 )
-
-        contents.append(
-            types.Content(
-                role="user",
-                parts=[types.Part.from_text(transcript)],
             )
-        )
 
-        return contents
+        return [*self._history_contents, user_content]
 
     async def stream_response(
         self,
         transcript: str,
-        messages: list[dict[str, str]] | None,
+        messages: Iterable[dict[str, str]] | None,
         system_prompt: str,
     ) -> str:
         """Stream a response from Gemini.
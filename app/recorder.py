@@ -17,7 +17,9 @@ class AudioRecorder:
     def __init__(self, config: Config):
         self._config = config
         self._recording = False
-        self._frames: list[np.ndarray] = []
+        self._wf: Optional[wave.Wave_write] = None
+        self._path: Optional[str] = None
+        self._frames_written = 0
         self._thread: Optional[threading.Thread] = None
         self._lock = threading.Lock()
 
@@ -25,8 +27,8 @@ class AudioRecorder:
         with self._lock:
             if self._recording:
                 return False
+            self._open_wav()
             self._recording = True
-            self._frames = []
 
         self._thread = threading.Thread(target=self._capture_loop, daemon=True)
         self._thread.start()
@@ -41,10 +43,8 @@ class AudioRecorder:
         if self._thread:
             self._thread.join(timeout=2.0)
 
-        if not self._frames:
-            return None
-
-        return self._save_wav()
+        with self._lock:
+            return self._close_wav()
 
     def _capture_loop(self):
         try:
@@ -52,28 +52,41 @@ class AudioRecorder:
             with loopback.recorder(samplerate=self.SAMPLE_RATE, channels=self.CHANNELS) as recorder:
                 while self._recording:
                     data = recorder.record(numframes=self.SAMPLE_RATE // 10)
+                    audio_int16 = (np.clip(data, -1.0, 1.0) * 32767).astype(np.int16)
                     with self._lock:
-                        if self._recording:
-                            self._frames.append(data)
+                        if self._recording and self._wf is not None:
+                            self._wf.writeframes(audio_int16.tobytes())
+                            self._frames_written += len(audio_int16)
         except Exception:
             with self._lock:
                 self._recording = False
+                self._close_wav(discard=True)
 
-    def _save_wav(self) -> str:
+    def _open_wav(self) -> None:
         os.makedirs(self._config.image_temp_dir, exist_ok=True)
 
         fd, path = tempfile.mkstemp(suffix='.wav', dir=self._config.image_temp_dir)
         os.close(fd)
 
-        audio_data = np.concatenate(self._frames, axis=0)
-        audio_data = np.clip(audio_data, -1.0, 1.0)
-        audio_int16 = (audio_data * 32767).astype(np.int16)
+        wf = wave.open(path, 'wb')
+        wf.setnchannels(self.CHANNELS)
+        wf.setsampwidth(2)
+        wf.setframerate(self.SAMPLE_RATE)
+        self._wf = wf
+        self._path = path
+        self._frames_written = 0
+
+    def _close_wav(self, discard: bool = False) -> Optional[str]:
+        wf, path = self._wf, self._path
+        self._wf = None
+        self._path = None
+        if wf is None or path is None:
+            return None
 
-        with wave.open(path, 'wb') as wf:
-            wf.setnchannels(self.CHANNELS)
-            wf.setsampwidth(2)
-            wf.setframerate(self.SAMPLE_RATE)
-            wf.writeframes(audio_int16.tobytes())
+        wf.close()
+        if discard or not self._frames_written:
+            os.remove(path)
+            return None
 
         return path
 
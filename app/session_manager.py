@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable, Iterator
 
 if TYPE_CHECKING:
     from typing import Literal
@@ -19,8 +19,9 @@ class SessionManager:
 
     def __init__(self) -> None:
         """Initialize session manager with empty state."""
-        self._messages: list[dict[str, str]] = []
+        self._messages: list[tuple[str, str]] = []
         self._persistent_mode: bool = True
+        self._clear_listeners: list[Callable[[], None]] = []
 
     @property
     def persistent_mode(self) -> bool:
@@ -46,7 +47,7 @@ class SessionManager:
         """
         if not content.strip():
             return
-        self._messages.append({"role": "user", "content": content})
+        self._messages.append(("user", content))
         logger.debug("Added user message, total messages: %d", len(self._messages))
 
     def add_assistant_message(self, content: str) -> None:
@@ -57,21 +58,40 @@ class SessionManager:
         """
         if not content.strip():
             return
-        self._messages.append({"role": "assistant", "content": content})
+        self._messages.append(("assistant", content))
         logger.debug("Added assistant message, total messages: %d", len(self._messages))
 
+    def iter_messages(self) -> Iterator[dict[str, str]]:
+        """Iterate over the conversation history without copying it.
+
+        Yields:
+            Fresh message dicts with 'role' and 'content' keys, so callers
+            can build a request payload in a single pass.
+        """
+        return ({"role": role, "content": content} for role, content in self._messages)
+
     def get_messages(self) -> list[dict[str, str]]:
-        """Get a copy of the conversation history.
+        """Get a snapshot of the conversation history.
 
         Returns:
-            Copy of messages list to prevent external modification.
+            New list of message dicts, independent of internal storage.
+        """
+        return list(self.iter_messages())
+
+    def add_clear_listener(self, callback: Callable[[], None]) -> None:
+        """Register a callback to run whenever the history is cleared.
+
+        Args:
+            callback: Called with no arguments after the history is emptied.
         """
-        return self._messages.copy()
+        self._clear_listeners.append(callback)
 
     def clear(self) -> None:
         """Clear all conversation history."""
         count = len(self._messages)
         self._messages.clear()
+        for callback in self._clear_listeners:
+            callback()
         logger.debug("Session cleared, removed %d messages", count)
 
     def is_empty(self) -> bool:
@@ -1,24 +1,30 @@
 from __future__ import annotations
 
 import asyncio
+import base64
+import ctypes
+import functools
 import logging
 import os
-import subprocess
-import threading
-from typing import Optional, Callable
-
-from pynput import keyboard as pynput_keyboard
+import sys
+from typing import TYPE_CHECKING, Any, Coroutine, Final, Optional, Callable
 
 from PyQt6.QtWidgets import (
     QApplication, QSystemTrayIcon, QMenu, QWidget,
-    QVBoxLayout, QHBoxLayout, QPushButton
+    QHBoxLayout, QPushButton
+)
+from PyQt6.QtCore import (
+    Qt, QTimer, pyqtSignal, pyqtSlot, QMetaObject, QObject, QPoint, QRect, QSize
+)
+from PyQt6.QtGui import (
+    QIcon, QPixmap, QPainter, QColor, QFont, QScreen, QAction, QActionGroup,
+    QKeySequence, QShortcut
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QObject, QPoint
-from PyQt6.QtGui import QIcon, QPixmap, QPainter, QColor, QAction, QActionGroup
 
 from config import Config
 from contracts import ClipboardPayload, PayloadType
 from app.clipboard import ClipboardMonitor
+from app.hotkeys import HotkeyFilter, VK_ESCAPE, VK_F8, VK_F9, VK_F10
 from app.typer import HumanTyper
 from app.stealth import make_stealth
 from app.overlay import StealthOverlay
@@ -26,19 +32,167 @@ from app.deepgram_client import DeepgramStreamingClient
 from app.claude_client import ClaudeStreamingClient
 from app.loopback_client import LoopbackStreamingClient
 from app.session_manager import SessionManager
-from app.providers import ClaudeProvider, GeminiProvider
+from app.providers import ClaudeProvider
 from app.providers.base import BaseProvider
 
+if TYPE_CHECKING:
+    from pynput import keyboard as pynput_keyboard
+
 logger = logging.getLogger(__name__)
 
+_SYSTEM_PROMPT_BASE: Final[str] = """CRITICAL RULES:
+- This is verbal - I speak your response aloud
+- No code blocks ever
+- First person only ("I built..." not "You could say...")
+- 75-100 words max
+- Lead with the answer, no preamble
+- Be direct and confident"""
+
+_SOLVE_INSTRUCTION: Final[str] = """Solve this problem. Output ONLY the solution code.
+CODE RULES:
+- Use markdown code blocks with language tags
+- Add brief inline comments on non-obvious lines only
+- Include time/space complexity as a comment at the end
+- Prefer readability over cleverness"""
+
+_EXPLAIN_INSTRUCTION: Final[str] = """You are ME in a technical interview for a Python backend/platform role. Use my resume context above. Speak as if YOU lived these experiences.
+
+CRITICAL: THIS IS A VERBAL INTERVIEW - I will be SPEAKING your response out loud.
+- NO CODE BLOCKS. Never. I cannot recite code verbally.
+- Explain concepts conversationally, like you're talking to the interviewer
+- A one-liner pseudocode reference is okay
+- Keep responses under 30 seconds of speaking time (~75-100 words)
+
+RESPONSE RULES:
+- First-person ONLY. Say "I built..." not "You could say..."
+- Lead with the answer. No preamble.
+- Be concise. Interviewers can ask follow-ups.
+
+FOR BEHAVIORAL: Use STAR format, pull from resume.
+FOR SYSTEM DESIGN: Components, data flow, trade-offs in plain English.
+FOR TECHNICAL: Clear explanation, bridge to experience.
+
+TONE: Confident peer."""
+
+_GIT_PROMPT: Final[str] = """Analyze this screenshot of code changes/diff. Generate a conventional commit message.
+
+Format: <type>(<scope>): <description>
+
+Types: feat, fix, refactor, docs, test, chore, style, perf
+- Keep under 72 chars
+- Imperative mood ("add" not "added")
+- No period at end
+
+Output ONLY the commit message, nothing else."""
+
+_INTERIM_PREFIX: Final[str] = "\U0001F3A4 "
+
+_BUTTON_RULE_TEMPLATE = """
+    #{name} {{
+        background-color: {bg};
+        color: white;
+        border: none;
+        border-radius: 6px;
+        font-size: {font}px;
+        font-weight: bold;
+    }}
+    #{name}:enabled:hover {{
+        background-color: {hover};
+    }}
+"""
+
+
+def _button_rule(name: str, bg: str, hover: str, font: int = 16) -> str:
+    return _BUTTON_RULE_TEMPLATE.format(name=name, bg=bg, hover=hover, font=font)
+
+
+# One sheet for the whole toolbar, applied once. Enabled/disabled is picked
+# up through the :disabled pseudo-state and recording through the dynamic
+# "recording" property, so state changes never re-parse QSS.
+_TOOLBAR_STYLE: Final[str] = "".join((
+    "#floatingToolbar { background-color: rgba(45, 45, 45, 230); border-radius: 6px; }",
+    _button_rule("snipButton", "#9b59b6", "#a569c6", font=18),
+    _button_rule("audioButton", "#e74c3c", "#f75c4c", font=18),
+    _button_rule('audioButton[recording="true"]', "#27ae60", "#2ecc71", font=18),
+    _button_rule("solveButton", "#27ae60", "#2ecc71"),
+    _button_rule("explainButton", "#3498db", "#5dade2"),
+    _button_rule("gitButton", "#f39c12", "#f5b041"),
+    _button_rule("resetButton", "#7f8c8d", "#95a5a6"),
+    """
+    #solveButton:disabled, #explainButton:disabled, #gitButton:disabled {
+        background-color: #555555;
+        color: #888888;
+    }
+""",
+))
+
+_SCREENCLIP_URI = "ms-screenclip:"
+
+_GLYPH_PIXEL_SIZE = 18
+_GLYPH_SNIP = "\u25f2"
+_GLYPH_RECORD = "\u25cf"
+_GLYPH_STOP = "\u25a0"
+
+
+async def _extract_page_text(index: int, payload: ClipboardPayload) -> str:
+    """Return the prompt block for one queued snip, running OCR on images."""
+    if payload.payload_type != PayloadType.IMAGE:
+        return f"[Page {index}]\n{payload.content}"
+    from app.ocr import WindowsOCR
+    ocr_result = await WindowsOCR().extract_text_async(payload.content)
+    if ocr_result.success and ocr_result.text:
+        return f"[Page {index}]\n{ocr_result.text}"
+    return f"[Page {index}]\n(OCR failed)"
+
+
+def _make_gemini_provider(pro: bool) -> BaseProvider:
+    # Built on first selection, so the Gemini SDK is never loaded for Claude-only use.
+    from app.providers.gemini_provider import GeminiProvider
+    return GeminiProvider(model=GeminiProvider.MODEL_PRO if pro else GeminiProvider.MODEL_FLASH)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_context_cached(path: str, mtime_ns: int) -> str:
+    """Read a context file; the mtime key invalidates stale entries."""
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read().strip()
+
+
+# 32x32 RGBA PNG: grey rounded square with three white text lines.
+_TRAY_ICON_PNG: Final[bytes] = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAASElEQVR42mNgGAVoICoq6j8t"
+    "8YBajtcR9LIcpyNGHTDoHEBtMOqA0UQ4mgtGHTCaCEdOLhh1wGgiHHXA0HXAgHdMBkXXbEQC"
+    "AFn1aNzDHfhLAAAAAElFTkSuQmCC"
+)
+
+
+@functools.cache
+def _build_tray_icon() -> QIcon:
+    pixmap = QPixmap()
+    pixmap.loadFromData(_TRAY_ICON_PNG, "PNG")
+    return QIcon(pixmap)
+
+
+@functools.cache
+def _glyph_icon(glyph: str) -> QIcon:
+    """Render a button glyph once so state changes only swap icons."""
+    size = _GLYPH_PIXEL_SIZE + 4
+    pixmap = QPixmap(size, size)
+    pixmap.fill(QColor(0, 0, 0, 0))
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    font = QFont()
+    font.setPixelSize(_GLYPH_PIXEL_SIZE)
+    font.setBold(True)
+    painter.setFont(font)
+    painter.setPen(QColor("#ffffff"))
+    painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, glyph)
+    painter.end()
+    return QIcon(pixmap)
+
 
 class SignalBridge(QObject):
-    clipboard_changed = pyqtSignal(object)
-    analysis_complete = pyqtSignal(str)
-    audio_complete = pyqtSignal(str)
-    streaming_error = pyqtSignal(str)
-    hotkey_pressed = pyqtSignal()
-    text_input_pressed = pyqtSignal()
+    clear_session_enabled = pyqtSignal(bool)
 
 
 class FloatingToolbar(QWidget):
@@ -52,17 +206,22 @@ class FloatingToolbar(QWidget):
         config: Config = None
     ) -> None:
         super().__init__()
-        self._drag_pos: QPoint | None = None
+        self._drag_start_global: QPoint | None = None
+        self._drag_start_pos: QPoint | None = None
         self._on_audio_callback = on_audio_click
         self._on_solve_callback = on_solve_click
         self._on_explain_callback = on_explain_click
         self._on_git_callback = on_git_click
         self._on_reset_callback = on_reset_click
         self._config = config or Config()
-        self._is_recording = False
+        self._state = (False, False, False)
         self._clipboard_ready = False
         self._image_ready = False
         self._queue_count = 0
+        self._screen = QApplication.primaryScreen()
+        self._screen_geometry = self._screen.availableGeometry()
+        self._screen.availableGeometryChanged.connect(self._on_available_geometry_changed)
+        QApplication.instance().primaryScreenChanged.connect(self._on_primary_screen_changed)
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -72,227 +231,121 @@ class FloatingToolbar(QWidget):
             Qt.WindowType.Tool
         )
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        # Paint the rounded panel on the toolbar itself; id selectors keep
+        # each rule from cascading into the other widgets.
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground)
+        self.setObjectName("floatingToolbar")
+        self.setStyleSheet(_TOOLBAR_STYLE)
 
-        self._container = QWidget()
-        self._container.setStyleSheet("background-color: rgba(45, 45, 45, 230); border-radius: 6px;")
-
-        layout = QHBoxLayout(self._container)
+        layout = QHBoxLayout(self)
         layout.setContentsMargins(4, 4, 4, 4)
         layout.setSpacing(4)
 
         btn_size = self._config.button_size
 
-        self._snip_btn = QPushButton("\u25f2")
-        self._snip_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #9b59b6;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                font-size: 18px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #a569c6;
-            }
-        """)
+        glyph_size = QSize(_GLYPH_PIXEL_SIZE + 4, _GLYPH_PIXEL_SIZE + 4)
+
+        self._snip_btn = QPushButton()
+        self._snip_btn.setIcon(_glyph_icon(_GLYPH_SNIP))
+        self._snip_btn.setIconSize(glyph_size)
+        self._snip_btn.setObjectName("snipButton")
         self._snip_btn.setFixedSize(btn_size, btn_size)
         self._snip_btn.clicked.connect(self._on_snip_click)
         layout.addWidget(self._snip_btn)
 
-        self._audio_btn = QPushButton("\u25cf")
-        self._audio_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                font-size: 18px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #f75c4c;
-            }
-        """)
+        self._audio_btn = QPushButton()
+        self._audio_btn.setIcon(_glyph_icon(_GLYPH_RECORD))
+        self._audio_btn.setIconSize(glyph_size)
+        self._audio_btn.setObjectName("audioButton")
+        self._audio_btn.setProperty("recording", False)
         self._audio_btn.setFixedSize(btn_size, btn_size)
         self._audio_btn.setToolTip("Click to record")
         self._audio_btn.clicked.connect(self._on_audio_click)
         layout.addWidget(self._audio_btn)
 
         self._solve_btn = QPushButton("S")
+        self._solve_btn.setObjectName("solveButton")
         self._solve_btn.setFixedSize(btn_size, btn_size)
         self._solve_btn.setEnabled(False)
         self._solve_btn.clicked.connect(self._on_solve_click)
-        self._update_solve_style()
         layout.addWidget(self._solve_btn)
 
         self._explain_btn = QPushButton("A")
+        self._explain_btn.setObjectName("explainButton")
         self._explain_btn.setFixedSize(btn_size, btn_size)
         self._explain_btn.setEnabled(False)
         self._explain_btn.clicked.connect(self._on_explain_click)
-        self._update_explain_style()
         layout.addWidget(self._explain_btn)
 
         self._git_btn = QPushButton("G")
+        self._git_btn.setObjectName("gitButton")
         self._git_btn.setFixedSize(btn_size, btn_size)
         self._git_btn.setEnabled(False)
         self._git_btn.setToolTip("Generate commit message from screenshot")
         self._git_btn.clicked.connect(self._on_git_click)
-        self._update_git_style()
         layout.addWidget(self._git_btn)
 
         self._reset_btn = QPushButton("R")
         self._reset_btn.setFixedSize(btn_size, btn_size)
         self._reset_btn.setToolTip("Reset conversation")
         self._reset_btn.clicked.connect(self._on_reset_click)
-        self._reset_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #7f8c8d;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                font-size: 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #95a5a6;
-            }
-        """)
+        self._reset_btn.setObjectName("resetButton")
         layout.addWidget(self._reset_btn)
 
-        main_layout = QVBoxLayout(self)
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        main_layout.addWidget(self._container)
-
+    @pyqtSlot()
     def _on_snip_click(self) -> None:
-        subprocess.run(['explorer', 'ms-screenclip:'], shell=True, creationflags=subprocess.CREATE_NO_WINDOW)
+        if sys.platform != "win32":
+            return
+        result = ctypes.windll.shell32.ShellExecuteW(None, "open", _SCREENCLIP_URI, None, None, 1)
+        # Values of 32 or less are ShellExecute error codes.
+        if result <= 32:
+            logger.warning("Failed to launch %s (ShellExecute returned %d)", _SCREENCLIP_URI, result)
 
+    @pyqtSlot()
     def _on_audio_click(self) -> None:
         if self._on_audio_callback:
             self._on_audio_callback()
 
+    @pyqtSlot()
     def _on_solve_click(self) -> None:
         if self._on_solve_callback and self._clipboard_ready:
             self._on_solve_callback()
 
+    @pyqtSlot()
     def _on_explain_click(self) -> None:
         if self._on_explain_callback and self._clipboard_ready:
             self._on_explain_callback()
 
+    @pyqtSlot()
     def _on_git_click(self) -> None:
         if self._on_git_callback and self._image_ready:
             self._on_git_callback()
 
+    @pyqtSlot()
     def _on_reset_click(self) -> None:
         if self._on_reset_callback:
             self._on_reset_callback()
 
-    def _update_solve_style(self) -> None:
-        if self._solve_btn.isEnabled():
-            self._solve_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #27ae60;
-                    color: white;
-                    border: none;
-                    border-radius: 6px;
-                    font-size: 16px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #2ecc71;
-                }
-            """)
-        else:
-            self._solve_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #555555;
-                    color: #888888;
-                    border: none;
-                    border-radius: 6px;
-                    font-size: 16px;
-                    font-weight: bold;
-                }
-            """)
-
-    def _update_explain_style(self) -> None:
-        if self._explain_btn.isEnabled():
-            self._explain_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #3498db;
-                    color: white;
-                    border: none;
-                    border-radius: 6px;
-                    font-size: 16px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #5dade2;
-                }
-            """)
-        else:
-            self._explain_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #555555;
-                    color: #888888;
-                    border: none;
-                    border-radius: 6px;
-                    font-size: 16px;
-                    font-weight: bold;
-                }
-            """)
-
-    def _update_git_style(self) -> None:
-        if self._git_btn.isEnabled():
-            self._git_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #f39c12;
-                    color: white;
-                    border: none;
-                    border-radius: 6px;
-                    font-size: 16px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #f5b041;
-                }
-            """)
-        else:
-            self._git_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #555555;
-                    color: #888888;
-                    border: none;
-                    border-radius: 6px;
-                    font-size: 16px;
-                    font-weight: bold;
-                }
-            """)
-
-    def set_clipboard_ready(self, ready: bool) -> None:
-        self._clipboard_ready = ready
-        self._solve_btn.setEnabled(ready)
-        self._explain_btn.setEnabled(ready)
-        self._update_solve_style()
-        self._update_explain_style()
-
-    def set_image_ready(self, ready: bool) -> None:
-        self._image_ready = ready
-        self._git_btn.setEnabled(ready)
-        self._update_git_style()
-
-    def set_processing(self, processing: bool) -> None:
-        self._solve_btn.setEnabled(not processing and self._clipboard_ready)
-        self._explain_btn.setEnabled(not processing and self._clipboard_ready)
-        if processing:
-            self._solve_btn.setText("...")
-            self._explain_btn.setText("...")
-        else:
-            self._update_button_labels()
-        self._update_solve_style()
-        self._update_explain_style()
+    def _set_recording_style(self, recording: bool) -> None:
+        # Property selectors are only re-matched on polish.
+        self._audio_btn.setProperty("recording", recording)
+        style = self._audio_btn.style()
+        style.unpolish(self._audio_btn)
+        style.polish(self._audio_btn)
 
-    def set_queue_count(self, count: int) -> None:
+    def set_queue(self, count: int, image_ready: bool | None = None) -> None:
+        """Update everything that depends on the pending queue in one pass."""
         self._queue_count = count
+        self._clipboard_ready = count > 0
+        if image_ready is not None:
+            self._image_ready = image_ready
+            self._git_btn.setEnabled(image_ready)
+        # While a request runs, apply_state(processing=False) re-enables and
+        # relabels Solve/Explain from the stored count.
+        if self._state[1]:
+            return
+        self._solve_btn.setEnabled(self._clipboard_ready)
+        self._explain_btn.setEnabled(self._clipboard_ready)
         self._update_button_labels()
 
     def _update_button_labels(self) -> None:
@@ -303,110 +356,160 @@ class FloatingToolbar(QWidget):
             self._solve_btn.setText("S")
             self._explain_btn.setText("A")
 
-    def set_recording_state(self, is_recording: bool) -> None:
-        self._is_recording = is_recording
-        if is_recording:
-            self._audio_btn.setText("■")
-            self._audio_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #27ae60;
-                    color: white;
-                    border: none;
-                    border-radius: 6px;
-                    font-size: 18px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #2ecc71;
-                }
-            """)
-            self._audio_btn.setToolTip("Listening... Click to stop")
-        else:
-            self._audio_btn.setText("●")
-            self._audio_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #e74c3c;
-                    color: white;
-                    border: none;
-                    border-radius: 6px;
-                    font-size: 18px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #f75c4c;
-                }
-            """)
-            self._audio_btn.setToolTip("Click to record")
-
-    def set_audio_processing(self, processing: bool) -> None:
-        self._audio_btn.setEnabled(not processing)
-        if processing:
-            self._audio_btn.setText("...")
-        else:
-            self.set_recording_state(False)
+    def apply_state(
+        self,
+        *,
+        recording: bool | None = None,
+        processing: bool | None = None,
+        audio_processing: bool | None = None,
+    ) -> None:
+        """Update recording/processing state, touching only widgets that changed.
+
+        Args:
+            recording: Whether audio capture is active.
+            processing: Whether a Solve/Explain request is running.
+            audio_processing: Whether a recorded transcript is being answered.
+        """
+        old_recording, old_processing, old_audio = self._state
+        state = (
+            old_recording if recording is None else recording,
+            old_processing if processing is None else processing,
+            old_audio if audio_processing is None else audio_processing,
+        )
+        if state == self._state:
+            return
+        self._state = state
+        new_recording, new_processing, new_audio = state
+
+        if new_processing != old_processing:
+            self._solve_btn.setEnabled(not new_processing and self._clipboard_ready)
+            self._explain_btn.setEnabled(not new_processing and self._clipboard_ready)
+            if new_processing:
+                self._solve_btn.setText("...")
+                self._explain_btn.setText("...")
+            else:
+                self._update_button_labels()
+
+        if new_audio != old_audio:
+            self._audio_btn.setEnabled(not new_audio)
+        if new_recording != old_recording:
+            self._set_recording_style(new_recording)
+        if new_audio:
+            if not old_audio:
+                self._audio_btn.setIcon(QIcon())
+                self._audio_btn.setText("...")
+        elif old_audio or new_recording != old_recording:
+            self._audio_btn.setText("")
+            if new_recording:
+                self._audio_btn.setIcon(_glyph_icon(_GLYPH_STOP))
+                self._audio_btn.setToolTip("Listening... Click to stop")
+            else:
+                self._audio_btn.setIcon(_glyph_icon(_GLYPH_RECORD))
+                self._audio_btn.setToolTip("Click to record")
 
     def position_near_overlay(self, overlay_x: int, overlay_y: int, overlay_width: int) -> None:
-        self.adjustSize()
-        x = overlay_x + overlay_width + 10
-        y = overlay_y
-        self.move(x, y)
+        hint = self.sizeHint()
+        self.setGeometry(overlay_x + overlay_width + 10, overlay_y, hint.width(), hint.height())
+
+    @pyqtSlot(QScreen)
+    def _on_primary_screen_changed(self, screen: QScreen) -> None:
+        try:
+            self._screen.availableGeometryChanged.disconnect(self._on_available_geometry_changed)
+        except (TypeError, RuntimeError):
+            # The old screen may already be gone after a hot-unplug.
+            pass
+        self._screen = screen
+        self._screen_geometry = screen.availableGeometry()
+        screen.availableGeometryChanged.connect(self._on_available_geometry_changed)
+
+    @pyqtSlot(QRect)
+    def _on_available_geometry_changed(self, geometry: QRect) -> None:
+        # Resolution, scaling or taskbar changes on the same screen.
+        self._screen_geometry = geometry
 
     def show_in_corner(self) -> None:
-        self.adjustSize()
-        screen = QApplication.primaryScreen().availableGeometry()
+        # One setGeometry instead of adjustSize + move: a single resize/move pair.
+        hint = self.sizeHint()
+        screen = self._screen_geometry
         x = screen.left() + 20
-        y = screen.bottom() - self.height() - 20
-        self.move(x, y)
+        y = screen.bottom() - hint.height() - 20
+        self.setGeometry(x, y, hint.width(), hint.height())
         self.show()
         make_stealth(self)
 
     def mousePressEvent(self, event) -> None:
         if event.button() == Qt.MouseButton.LeftButton:
-            self._drag_pos = event.globalPosition().toPoint() - self.frameGeometry().topLeft()
+            self._drag_start_global = event.globalPosition().toPoint()
+            self._drag_start_pos = self.pos()
             event.accept()
 
     def mouseMoveEvent(self, event) -> None:
-        if self._drag_pos and event.buttons() == Qt.MouseButton.LeftButton:
-            self.move(event.globalPosition().toPoint() - self._drag_pos)
+        if self._drag_start_global is not None and event.buttons() == Qt.MouseButton.LeftButton:
+            delta = event.globalPosition().toPoint() - self._drag_start_global
+            self.move(self._drag_start_pos + delta)
             event.accept()
 
     def mouseReleaseEvent(self, event) -> None:
-        self._drag_pos = None
+        self._drag_start_global = None
+        self._drag_start_pos = None
 
 
-class TrayApp:
+class TrayApp(QObject):
     PROVIDER_CLAUDE = "claude"
     PROVIDER_GEMINI_PRO = "gemini_pro"
     PROVIDER_GEMINI_FLASH = "gemini_flash"
+    PROVIDER_LABELS = (
+        (PROVIDER_CLAUDE, "Claude"),
+        (PROVIDER_GEMINI_PRO, "Gemini Pro"),
+        (PROVIDER_GEMINI_FLASH, "Gemini Flash"),
+    )
 
     CONTEXT_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "context.txt")
 
     def __init__(self, config: Config, loop: asyncio.AbstractEventLoop) -> None:
+        super().__init__()
         self._config = config
         self._loop = loop
         self._app = QApplication.instance()
 
         self._signals = SignalBridge()
-        self._signals.clipboard_changed.connect(self._on_clipboard_signal)
-        self._signals.analysis_complete.connect(self._on_analysis_complete)
-        self._signals.audio_complete.connect(self._on_audio_complete)
-        self._signals.streaming_error.connect(self._on_streaming_error)
-        self._signals.hotkey_pressed.connect(self._on_audio_button_click)
-        self._signals.text_input_pressed.connect(self._on_text_input)
 
         self._typer = HumanTyper()
         self._session_manager = SessionManager()
         self._is_recording = False
         self._is_responding = False
-        self._f9_pressed: bool = False
         self._pending_payloads: list[ClipboardPayload] = []
         self._streaming_task: Optional[asyncio.Task] = None
-        self._hotkey_listener: Optional[pynput_keyboard.Listener] = None
+        self._background_tasks: set[asyncio.Task] = set()
+        self._hotkey_filter: Optional[HotkeyFilter] = None
+        self._hotkey_listener: Optional[pynput_keyboard.GlobalHotKeys] = None
         self._pending_transcript: str = ""
         self._last_transcript: str = ""
+        self._pending_interim: str = ""
+        self._chunk_buffer: list[str] = []
+        self._chunk_timer = QTimer(self)
+        self._chunk_timer.setSingleShot(True)
+        self._chunk_timer.setInterval(16)
+        self._chunk_timer.timeout.connect(self._flush_chunks)
+        self._interim_timer = QTimer(self)
+        self._interim_timer.setSingleShot(True)
+        self._interim_timer.setInterval(33)
+        self._interim_timer.timeout.connect(self._flush_interim)
+        self._pending_mic_interim: str = ""
+        self._mic_interim_timer = QTimer(self)
+        self._mic_interim_timer.setSingleShot(True)
+        self._mic_interim_timer.setInterval(60)
+        self._mic_interim_timer.timeout.connect(self._flush_mic_interim)
+        self._audio_toggle_guard = QTimer(self)
+        self._audio_toggle_guard.setSingleShot(True)
+        self._audio_toggle_guard.setInterval(150)
+        self._audio_transition: Optional[asyncio.Task] = None
         self._system_prompt = self._build_system_prompt()
 
         self._overlay = StealthOverlay(config)
+        self._overlay_hide_timer = QTimer(self)
+        self._overlay_hide_timer.setSingleShot(True)
+        self._overlay_hide_timer.timeout.connect(self._overlay.hide)
 
         self._deepgram = DeepgramStreamingClient()
         self._claude = ClaudeStreamingClient()
@@ -416,36 +519,66 @@ class TrayApp:
             self._config.question_silence_threshold_ms
         )
 
-        self._claude_provider = ClaudeProvider()
-        self._gemini_pro_provider = GeminiProvider(model=GeminiProvider.MODEL_PRO)
-        self._gemini_flash_provider = GeminiProvider(model=GeminiProvider.MODEL_FLASH)
-        self._active_provider: BaseProvider = self._claude_provider
-        self._active_provider_name = self.PROVIDER_CLAUDE
+        self._provider_factories: dict[str, Callable[[], BaseProvider]] = {
+            self.PROVIDER_CLAUDE: ClaudeProvider,
+            self.PROVIDER_GEMINI_PRO: functools.partial(_make_gemini_provider, pro=True),
+            self.PROVIDER_GEMINI_FLASH: functools.partial(_make_gemini_provider, pro=False),
+        }
+        self._providers: dict[str, BaseProvider] = {}
 
         self._connect_streaming_signals()
         self._connect_loopback_signals()
-        self._connect_provider_signals()
+
+        self._active_provider = self._get_provider(self.PROVIDER_CLAUDE)
+        self._active_provider_name = self.PROVIDER_CLAUDE
 
         self._setup_tray()
         self._setup_toolbar()
         self._setup_clipboard_monitor()
         self._setup_hotkey()
 
-        asyncio.run_coroutine_threadsafe(self._warm_up_loopback(), self._loop)
+        self._spawn(self._warm_up_loopback())
+
+    def _spawn(self, coro: Coroutine[Any, Any, Any]) -> asyncio.Task:
+        """Schedule a coroutine on the app loop and keep it referenced until done."""
+        if sys.version_info >= (3, 12):
+            # Run our own tasks up to their first real await in the caller's
+            # turn; library tasks keep the loop's default scheduling.
+            task = asyncio.eager_task_factory(self._loop, coro)
+        else:
+            task = self._loop.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
+    def _queue_audio_transition(self, coro: Coroutine[Any, Any, Any]) -> None:
+        """Run a loopback start/stop only after the previous one has finished.
+
+        start_streaming returns once capture is set up (cold starts hand the
+        stream itself to a separate task), so a queued stop never waits on it.
+        """
+        previous = self._audio_transition
+
+        async def run() -> None:
+            if previous is not None and not previous.done():
+                await asyncio.wait((previous,))
+            await coro
+
+        self._audio_transition = self._spawn(run())
 
     async def _warm_up_loopback(self) -> None:
         success = await self._loopback.warm_up()
         if success:
-            print("[DEBUG] Loopback pre-warmed successfully")
+            logger.debug("Loopback pre-warmed successfully")
         else:
-            print("[DEBUG] Loopback warm-up failed, will use cold start")
+            logger.warning("Loopback warm-up failed, will use cold start")
 
     def _connect_streaming_signals(self) -> None:
-        self._deepgram.interim_transcript.connect(self._overlay.interim_transcript.emit)
+        self._deepgram.interim_transcript.connect(self._on_mic_interim)
         self._deepgram.final_transcript.connect(self._on_final_transcript)
         self._deepgram.error_occurred.connect(self._on_streaming_error)
 
-        self._claude.text_chunk.connect(self._overlay.text_chunk_received.emit)
+        self._claude.text_chunk.connect(self._on_text_chunk)
         self._claude.response_complete.connect(self._on_response_complete)
         self._claude.error_occurred.connect(self._on_streaming_error)
 
@@ -455,77 +588,39 @@ class TrayApp:
         self._loopback.error_occurred.connect(self._on_streaming_error)
         # silence_detected disabled - full manual control with F9
 
-    def _disconnect_loopback_signals(self) -> None:
-        try:
-            self._loopback.interim_interviewer.disconnect(self._on_interim_update)
-        except TypeError:
-            pass
-        try:
-            self._loopback.final_interviewer.disconnect(self._on_interim_update)
-        except TypeError:
-            pass
-
-    def _reconnect_loopback_signals(self) -> None:
-        try:
-            self._loopback.interim_interviewer.disconnect(self._on_interim_update)
-        except TypeError:
-            pass
-        try:
-            self._loopback.final_interviewer.disconnect(self._on_interim_update)
-        except TypeError:
-            pass
-        self._loopback.interim_interviewer.connect(self._on_interim_update)
-        self._loopback.final_interviewer.connect(self._on_interim_update)
-
-    def _connect_provider_signals(self) -> None:
-        """Connect all provider signals to overlay handlers."""
-        for provider in (
-            self._claude_provider,
-            self._gemini_pro_provider,
-            self._gemini_flash_provider,
-        ):
-            provider.text_chunk.connect(self._overlay.text_chunk_received.emit)
-            provider.response_complete.connect(self._on_response_complete)
-            provider.error_occurred.connect(self._on_streaming_error)
+    def _get_provider(self, name: str) -> BaseProvider:
+        """Return the provider for a name, creating it on first use."""
+        provider = self._providers.get(name)
+        if provider is None:
+            provider = self._provider_factories[name]()
+            self._connect_provider_signals(provider)
+            self._providers[name] = provider
+        return provider
+
+    def _connect_provider_signals(self, provider: BaseProvider) -> None:
+        """Connect a provider's signals to overlay handlers."""
+        provider.text_chunk.connect(self._on_text_chunk)
+        provider.response_complete.connect(self._on_response_complete)
+        provider.error_occurred.connect(self._on_streaming_error)
+        self._session_manager.add_clear_listener(provider.reset_history_cache)
 
     def _load_context(self) -> str:
         """Load context from context.txt file."""
         try:
-            with open(self.CONTEXT_PATH, "r", encoding="utf-8") as f:
-                return f.read().strip()
+            mtime_ns = os.stat(self.CONTEXT_PATH).st_mtime_ns
+            return _load_context_cached(self.CONTEXT_PATH, mtime_ns)
         except FileNotFoundError:
             return ""
 
     def _build_system_prompt(self) -> str:
         """Build the system prompt with context and base instructions."""
         context = self._load_context()
-        base_instruction = """CRITICAL RULES:
-- This is verbal - I speak your response aloud
-- No code blocks ever
-- First person only ("I built..." not "You could say...")
-- 75-100 words max
-- Lead with the answer, no preamble
-- Be direct and confident"""
         if context:
-            return f"{context}\n\n---\n\n{base_instruction}"
-        return base_instruction
-
-    def _create_icon(self) -> QIcon:
-        pixmap = QPixmap(32, 32)
-        pixmap.fill(QColor(0, 0, 0, 0))
-        painter = QPainter(pixmap)
-        painter.setBrush(QColor("#5a5a5a"))
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawRoundedRect(2, 2, 28, 28, 4, 4)
-        painter.setBrush(QColor("#ffffff"))
-        painter.drawRect(6, 8, 20, 3)
-        painter.drawRect(6, 14, 20, 3)
-        painter.drawRect(6, 20, 14, 3)
-        painter.end()
-        return QIcon(pixmap)
+            return f"{context}\n\n---\n\n{_SYSTEM_PROMPT_BASE}"
+        return _SYSTEM_PROMPT_BASE
 
     def _setup_tray(self) -> None:
-        self._tray = QSystemTrayIcon(self._create_icon(), self._app)
+        self._tray = QSystemTrayIcon(_build_tray_icon(), self._app)
         self._tray.setToolTip("Clipboard Helper")
 
         menu = QMenu()
@@ -538,6 +633,7 @@ class TrayApp:
         self._clear_session_action = QAction("Clear Session")
         self._clear_session_action.triggered.connect(self._on_clear_session)
         self._clear_session_action.setEnabled(False)
+        self._signals.clear_session_enabled.connect(self._clear_session_action.setEnabled)
         menu.addAction(self._clear_session_action)
 
         menu.addSeparator()
@@ -546,21 +642,12 @@ class TrayApp:
         self._provider_action_group = QActionGroup(provider_menu)
         self._provider_action_group.setExclusive(True)
 
-        self._claude_action = QAction("Claude", checkable=True)
-        self._claude_action.setChecked(True)
-        self._claude_action.triggered.connect(lambda: self._on_provider_change(self.PROVIDER_CLAUDE))
-        self._provider_action_group.addAction(self._claude_action)
-        provider_menu.addAction(self._claude_action)
-
-        self._gemini_pro_action = QAction("Gemini Pro", checkable=True)
-        self._gemini_pro_action.triggered.connect(lambda: self._on_provider_change(self.PROVIDER_GEMINI_PRO))
-        self._provider_action_group.addAction(self._gemini_pro_action)
-        provider_menu.addAction(self._gemini_pro_action)
-
-        self._gemini_flash_action = QAction("Gemini Flash", checkable=True)
-        self._gemini_flash_action.triggered.connect(lambda: self._on_provider_change(self.PROVIDER_GEMINI_FLASH))
-        self._provider_action_group.addAction(self._gemini_flash_action)
-        provider_menu.addAction(self._gemini_flash_action)
+        for name, label in self.PROVIDER_LABELS:
+            action = QAction(label, self._provider_action_group, checkable=True)
+            action.setData(name)
+            action.setChecked(name == self._active_provider_name)
+            provider_menu.addAction(action)
+        self._provider_action_group.triggered.connect(self._on_provider_action)
 
         menu.addSeparator()
 
@@ -586,164 +673,109 @@ class TrayApp:
         self._monitor.start()
 
     def _setup_hotkey(self) -> None:
-        def on_press(key: pynput_keyboard.Key | pynput_keyboard.KeyCode | None) -> None:
-            try:
-                if key == pynput_keyboard.Key.f8:
-                    self._signals.text_input_pressed.emit()
-                elif key == pynput_keyboard.Key.f9:
-                    if not self._f9_pressed:
-                        self._f9_pressed = True
-                        print("[DEBUG] F9 hotkey pressed!")
-                        self._signals.hotkey_pressed.emit()
-                    else:
-                        print("[DEBUG] F9 ignored (key repeat)")
-                elif key == pynput_keyboard.Key.f10:
-                    self._on_retry_hotkey()
-                elif key == pynput_keyboard.Key.esc:
-                    self._on_cancel_response()
-            except Exception as e:
-                print(f"[DEBUG] Hotkey callback error: {e}")
-
-        def on_release(key: pynput_keyboard.Key | pynput_keyboard.KeyCode | None) -> None:
-            try:
-                if key == pynput_keyboard.Key.f9:
-                    self._f9_pressed = False
-            except Exception:
-                pass
+        if sys.platform == "win32":
+            self._setup_native_hotkeys()
+        else:
+            self._setup_pynput_hotkeys()
+
+    def _setup_native_hotkeys(self) -> None:
+        # Esc is only grabbed while a response streams; a permanent
+        # registration would swallow it for every other application.
+        self._hotkey_filter = HotkeyFilter(
+            {
+                VK_F8: self._on_text_input,
+                VK_F9: self._on_audio_button_click,
+                VK_F10: self._on_retry_hotkey,
+                VK_ESCAPE: self._on_cancel_response,
+            },
+            enabled={VK_F8, VK_F9, VK_F10},
+        )
+        self._hotkey_filter.install()
+        logger.debug("F8/F9/F10 hotkeys registered via RegisterHotKey")
 
+    def _setup_pynput_hotkeys(self) -> None:
         try:
-            self._hotkey_listener = pynput_keyboard.Listener(on_press=on_press, on_release=on_release)
+            # Only this fallback needs pynput, so Windows never pays for the import.
+            from pynput import keyboard as pynput_keyboard
+
+            # The listener calls back on its own thread; queue the slots onto ours.
+            self._hotkey_listener = pynput_keyboard.GlobalHotKeys({
+                "<f8>": functools.partial(self._invoke_queued, "_on_text_input"),
+                "<f9>": functools.partial(self._invoke_queued, "_on_audio_button_click"),
+            })
             self._hotkey_listener.start()
-            print("[DEBUG] F9/F10/Escape hotkeys registered via pynput")
+            logger.debug("F8/F9 hotkeys registered via pynput")
         except Exception as e:
-            print(f"[DEBUG] Failed to register hotkeys: {e}")
-
-    def _on_clipboard_change(self, payload: ClipboardPayload) -> None:
-        self._signals.clipboard_changed.emit(payload)
-
-    def _on_clipboard_signal(self, payload: ClipboardPayload) -> None:
-        self._pending_payloads.append(payload)
-        count = len(self._pending_payloads)
-        self._toolbar.set_clipboard_ready(True)
-        self._toolbar.set_queue_count(count)
-        self._toolbar.set_image_ready(payload.payload_type == PayloadType.IMAGE)
-        self._toolbar.set_processing(False)
-
-    def _on_solve_click(self) -> None:
-        if not self._pending_payloads:
-            return
-        self._toolbar.set_processing(True)
-        self._overlay.clear_and_show()
-
-        all_text_parts = []
-        from app.ocr import WindowsOCR
-        ocr = WindowsOCR()
-
-        for i, payload in enumerate(self._pending_payloads):
-            if payload.payload_type == PayloadType.IMAGE:
-                ocr_result = ocr.extract_text(payload.content)
-                if ocr_result.success and ocr_result.text:
-                    all_text_parts.append(f"[Page {i+1}]\n{ocr_result.text}")
-                else:
-                    all_text_parts.append(f"[Page {i+1}]\n(OCR failed)")
-            else:
-                all_text_parts.append(f"[Page {i+1}]\n{payload.content}")
-
-        text = "\n\n".join(all_text_parts)
+            logger.warning("Failed to register hotkeys: %s", e)
 
-        if not text.strip():
-            self._overlay.show_error("No text extracted from any image")
-            self._toolbar.set_processing(False)
-            return
+        # Retry and cancel only need to work while the toolbar is focused,
+        # so they stay in-process instead of going through the global hook.
+        QShortcut(QKeySequence("F10"), self._toolbar, activated=self._on_retry_hotkey)
+        QShortcut(QKeySequence("Esc"), self._toolbar, activated=self._on_cancel_response)
 
-        self._pending_payloads.clear()
-        self._toolbar.set_queue_count(0)
-        self._toolbar.set_clipboard_ready(False)
+    def _invoke_queued(self, slot: str) -> None:
+        QMetaObject.invokeMethod(self, slot, Qt.ConnectionType.QueuedConnection)
 
-        instruction = """Solve this problem. Output ONLY the solution code.
-CODE RULES:
-- Use markdown code blocks with language tags
-- Add brief inline comments on non-obvious lines only
-- Include time/space complexity as a comment at the end
-- Prefer readability over cleverness"""
-
-        prompt = f"{instruction}\n\nProblem:\n{text}"
-
-        display = f"[Solve] {len(all_text_parts)} page(s)"
-        self._overlay.show_transcript(display)
-        self._overlay.start_streaming_response()
-        self._last_transcript = prompt
+    def _set_responding(self, responding: bool) -> None:
+        self._is_responding = responding
+        if self._hotkey_filter is not None:
+            self._hotkey_filter.set_enabled(VK_ESCAPE, responding)
 
-        messages = self._session_manager.get_messages() if self._session_manager.persistent_mode else None
-        self._is_responding = True
-        asyncio.run_coroutine_threadsafe(
-            self._stream_and_track_response(prompt, messages),
-            self._loop
+    def _on_clipboard_change(self, payload: ClipboardPayload) -> None:
+        self._pending_payloads.append(payload)
+        self._toolbar.set_queue(
+            len(self._pending_payloads),
+            image_ready=payload.payload_type == PayloadType.IMAGE,
         )
+        self._toolbar.apply_state(processing=False)
+
+    def _on_solve_click(self) -> None:
+        self._process_clipboard_request(_SOLVE_INSTRUCTION, "Problem", "Solve")
 
     def _on_explain_click(self) -> None:
+        self._process_clipboard_request(_EXPLAIN_INSTRUCTION, "Question", "Analyze")
+
+    def _process_clipboard_request(self, instruction: str, heading: str, label: str) -> None:
         if not self._pending_payloads:
             return
-        self._toolbar.set_processing(True)
+        self._toolbar.apply_state(processing=True)
         self._overlay.clear_and_show()
+        self._streaming_task = self._spawn(
+            self._run_clipboard_request(instruction, heading, label, list(self._pending_payloads))
+        )
 
-        all_text_parts = []
-        from app.ocr import WindowsOCR
-        ocr = WindowsOCR()
-
-        for i, payload in enumerate(self._pending_payloads):
-            if payload.payload_type == PayloadType.IMAGE:
-                ocr_result = ocr.extract_text(payload.content)
-                if ocr_result.success and ocr_result.text:
-                    all_text_parts.append(f"[Page {i+1}]\n{ocr_result.text}")
-                else:
-                    all_text_parts.append(f"[Page {i+1}]\n(OCR failed)")
-            else:
-                all_text_parts.append(f"[Page {i+1}]\n{payload.content}")
+    async def _run_clipboard_request(
+        self,
+        instruction: str,
+        heading: str,
+        label: str,
+        payloads: list[ClipboardPayload],
+    ) -> None:
+        # WinRT OCR is awaitable on this loop; only image decoding uses a thread.
+        all_text_parts = await asyncio.gather(*(
+            _extract_page_text(i, payload)
+            for i, payload in enumerate(payloads, start=1)
+        ))
 
         text = "\n\n".join(all_text_parts)
 
         if not text.strip():
             self._overlay.show_error("No text extracted from any image")
-            self._toolbar.set_processing(False)
+            self._toolbar.apply_state(processing=False)
             return
 
-        self._pending_payloads.clear()
-        self._toolbar.set_queue_count(0)
-        self._toolbar.set_clipboard_ready(False)
-
-        instruction = """You are ME in a technical interview for a Python backend/platform role. Use my resume context above. Speak as if YOU lived these experiences.
-
-CRITICAL: THIS IS A VERBAL INTERVIEW - I will be SPEAKING your response out loud.
-- NO CODE BLOCKS. Never. I cannot recite code verbally.
-- Explain concepts conversationally, like you're talking to the interviewer
-- A one-liner pseudocode reference is okay
-- Keep responses under 30 seconds of speaking time (~75-100 words)
-
-RESPONSE RULES:
-- First-person ONLY. Say "I built..." not "You could say..."
-- Lead with the answer. No preamble.
-- Be concise. Interviewers can ask follow-ups.
-
-FOR BEHAVIORAL: Use STAR format, pull from resume.
-FOR SYSTEM DESIGN: Components, data flow, trade-offs in plain English.
-FOR TECHNICAL: Clear explanation, bridge to experience.
-
-TONE: Confident peer."""
+        del self._pending_payloads[:len(payloads)]
+        self._toolbar.set_queue(len(self._pending_payloads))
 
-        prompt = f"{instruction}\n\nQuestion:\n{text}"
+        prompt = f"{instruction}\n\n{heading}:\n{text}"
 
-        display = f"[Analyze] {len(all_text_parts)} page(s)"
+        display = f"[{label}] {len(all_text_parts)} page(s)"
         self._overlay.show_transcript(display)
         self._overlay.start_streaming_response()
         self._last_transcript = prompt
 
-        messages = self._session_manager.get_messages() if self._session_manager.persistent_mode else None
-        self._is_responding = True
-        asyncio.run_coroutine_threadsafe(
-            self._stream_and_track_response(prompt, messages),
-            self._loop
-        )
+        self._set_responding(True)
+        await self._stream_and_track_response(prompt)
 
     def _on_git_click(self) -> None:
         if not self._pending_payloads:
@@ -751,173 +783,185 @@ TONE: Confident peer."""
         payload = self._pending_payloads[-1]
         if payload.payload_type != PayloadType.IMAGE:
             return
-        self._toolbar.set_processing(True)
+        self._toolbar.apply_state(processing=True)
         self._overlay.clear_and_show()
         self._overlay.start_streaming_response()
-        prompt = """Analyze this screenshot of code changes/diff. Generate a conventional commit message.
-
-Format: <type>(<scope>): <description>
-
-Types: feat, fix, refactor, docs, test, chore, style, perf
-- Keep under 72 chars
-- Imperative mood ("add" not "added")
-- No period at end
-
-Output ONLY the commit message, nothing else."""
-        asyncio.run_coroutine_threadsafe(
-            self._claude.stream_vision_response(prompt, payload.content),
-            self._loop
+        self._streaming_task = self._spawn(
+            self._claude.stream_vision_response(_GIT_PROMPT, payload.content)
         )
 
-    def _on_analysis_complete(self, response: str) -> None:
-        self._toolbar.set_processing(False)
-        if self._config.stealth_enabled:
-            self._overlay.show_response(response)
-            self._toolbar.position_near_overlay(
-                self._overlay.x(),
-                self._overlay.y(),
-                self._overlay.width()
-            )
-        else:
-            self._typer.type_to_notepad(response)
-
+    @pyqtSlot(str)
     def _on_interim_update(self, text: str) -> None:
-        if self._is_responding:
+        if not self._is_recording or self._is_responding:
             return
         if text.strip():
-            self._overlay.show_response(f"🎤 {text}")
+            # Show the first partial at once, then at most one per tick; the
+            # latest one wins when they arrive faster than that.
+            self._pending_interim = text
+            if not self._interim_timer.isActive():
+                self._flush_interim()
+
+    @pyqtSlot()
+    def _flush_interim(self) -> None:
+        text = self._pending_interim
+        self._pending_interim = ""
+        if text and self._is_recording and not self._is_responding:
+            self._overlay.show_response(_INTERIM_PREFIX + text)
+            self._interim_timer.start()
+
+    @pyqtSlot(str)
+    def _on_mic_interim(self, text: str) -> None:
+        self._pending_mic_interim = text
+        if not self._mic_interim_timer.isActive():
+            self._mic_interim_timer.start()
+
+    @pyqtSlot()
+    def _flush_mic_interim(self) -> None:
+        text = self._pending_mic_interim
+        self._pending_mic_interim = ""
+        if text:
+            self._overlay.interim_transcript.emit(text)
 
     def _on_silence_detected(self) -> None:
         if not self._is_recording:
             return
-        print("[DEBUG] Silence auto-detected, sending to Claude")
+        logger.debug("Silence auto-detected, sending to Claude")
         self._is_recording = False
-        self._toolbar.set_recording_state(False)
-        asyncio.run_coroutine_threadsafe(self._loopback.stop_streaming(), self._loop)
-        transcript = self._loopback.get_transcript()
-        if transcript.strip():
-            self._disconnect_loopback_signals()
-            self._is_responding = True
+        self._queue_audio_transition(self._loopback.stop_streaming())
+        transcript = self._loopback.get_transcript() if self._loopback.has_transcript else ""
+        self._toolbar.apply_state(recording=False, audio_processing=bool(transcript))
+        if transcript:
+            self._set_responding(True)
             self._pending_transcript = transcript
-            self._toolbar.set_audio_processing(True)
             self._overlay.show_response("Processing...")
             self._overlay.show_transcript(transcript)
             self._overlay.start_streaming_response()
-            messages = (
-                self._session_manager.get_messages()
-                if self._session_manager.persistent_mode
-                else None
-            )
-            asyncio.run_coroutine_threadsafe(
-                self._stream_and_track_response(transcript, messages),
-                self._loop
+            self._streaming_task = self._spawn(
+                self._stream_and_track_response(transcript)
             )
         else:
             self._overlay.show_response("No speech detected")
 
+    @pyqtSlot()
     def _on_audio_button_click(self) -> None:
-        print(f"[DEBUG] Audio button clicked, is_recording={self._is_recording}")
+        # Swallow the second half of a double click instead of toggling back.
+        if self._audio_toggle_guard.isActive():
+            return
+        self._audio_toggle_guard.start()
+        logger.debug("Audio button clicked, is_recording=%s", self._is_recording)
         if not self._is_recording:
             self._is_recording = True
-            self._reconnect_loopback_signals()
-            self._toolbar.set_recording_state(True)
+            self._toolbar.apply_state(recording=True)
             self._overlay.clear_and_show()
             self._overlay.show_response("Listening...")
-            print("[DEBUG] Recording started, showing overlay")
-            asyncio.run_coroutine_threadsafe(self._loopback.start_streaming(), self._loop)
+            logger.debug("Recording started, showing overlay")
+            self._queue_audio_transition(self._loopback.start_streaming())
         else:
             self._is_recording = False
-            self._toolbar.set_recording_state(False)
-            asyncio.run_coroutine_threadsafe(self._loopback.stop_streaming(), self._loop)
-
-            transcript = self._loopback.get_transcript()
-            print(f"[DEBUG] Recording stopped, transcript length: {len(transcript)}")
-            if transcript.strip():
-                self._disconnect_loopback_signals()
-                self._is_responding = True
+            self._queue_audio_transition(self._loopback.stop_streaming())
+
+            transcript = self._loopback.get_transcript() if self._loopback.has_transcript else ""
+            logger.debug("Recording stopped, transcript length: %d", len(transcript))
+            self._toolbar.apply_state(recording=False, audio_processing=bool(transcript))
+            if transcript:
+                self._set_responding(True)
                 self._pending_transcript = transcript
-                self._toolbar.set_audio_processing(True)
                 self._overlay.show_transcript(transcript)
                 self._overlay.start_streaming_response()
-                messages = (
-                    self._session_manager.get_messages()
-                    if self._session_manager.persistent_mode
-                    else None
-                )
-                asyncio.run_coroutine_threadsafe(
-                    self._stream_and_track_response(transcript, messages),
-                    self._loop
+                self._streaming_task = self._spawn(
+                    self._stream_and_track_response(transcript)
                 )
             else:
                 self._overlay.show_response("No speech detected")
 
+    @pyqtSlot(str)
     def _on_final_transcript(self, transcript: str) -> None:
-        if not transcript.strip():
-            self._toolbar.set_audio_processing(False)
+        self._mic_interim_timer.stop()
+        self._pending_mic_interim = ""
+        transcript = transcript.strip()
+        if not transcript:
+            self._toolbar.apply_state(recording=False, audio_processing=False)
             self._overlay.show_error("No speech detected")
             return
 
         self._pending_transcript = transcript
         self._overlay.start_streaming_response()
-        messages = (
-            self._session_manager.get_messages()
-            if self._session_manager.persistent_mode
-            else None
-        )
-        asyncio.run_coroutine_threadsafe(
-            self._stream_and_track_response(transcript, messages),
-            self._loop
+        self._streaming_task = self._spawn(
+            self._stream_and_track_response(transcript)
         )
 
     def _on_interviewer_question(self, question: str) -> None:
-        if not question.strip():
+        question = question.strip()
+        if not question:
             return
+        self._overlay_hide_timer.stop()
         self._overlay.start_streaming_response()
-        asyncio.run_coroutine_threadsafe(
-            self._active_provider.stream_response(question, None, self._system_prompt),
-            self._loop
+        self._streaming_task = self._spawn(
+            self._active_provider.stream_response(question, None, self._system_prompt)
         )
 
-    async def _stream_and_track_response(
-        self,
-        transcript: str,
-        messages: list[dict[str, str]] | None,
-    ) -> None:
+    async def _stream_and_track_response(self, transcript: str) -> None:
         """Stream response from active provider and track in session if persistent mode enabled."""
+        # A hide scheduled by the previous response must not fire mid-stream.
+        self._overlay_hide_timer.stop()
         self._last_transcript = transcript
+        messages = (
+            self._session_manager.iter_messages()
+            if self._session_manager.persistent_mode
+            else None
+        )
         response = await self._active_provider.stream_response(
             transcript, messages, self._system_prompt
         )
         if self._session_manager.persistent_mode and response:
-            self._session_manager.add_user_message(transcript)
-            self._session_manager.add_assistant_message(response)
-            self._update_clear_session_action()
+            # Record the turn on the next loop pass so the stream task ends
+            # as soon as the last chunk is out.
+            self._loop.call_soon(self._persist_turn, transcript, response)
+
+    def _persist_turn(self, transcript: str, response: str) -> None:
+        self._session_manager.add_user_message(transcript)
+        self._session_manager.add_assistant_message(response)
+        self._update_clear_session_action()
 
+    @pyqtSlot(str)
+    def _on_text_chunk(self, text: str) -> None:
+        # Batch tokens so the overlay re-renders at most once per frame.
+        self._chunk_buffer.append(text)
+        if not self._chunk_timer.isActive():
+            self._chunk_timer.start()
+
+    @pyqtSlot()
+    def _flush_chunks(self) -> None:
+        self._chunk_timer.stop()
+        if self._chunk_buffer:
+            text = "".join(self._chunk_buffer)
+            self._chunk_buffer.clear()
+            self._overlay.text_chunk_received.emit(text)
+
+    def _discard_chunks(self) -> None:
+        self._chunk_timer.stop()
+        self._chunk_buffer.clear()
+
+    @pyqtSlot()
     def _on_response_complete(self) -> None:
-        self._is_responding = False
+        self._flush_chunks()
+        self._set_responding(False)
         self._pending_transcript = ""
-        self._toolbar.set_audio_processing(False)
-        self._toolbar.set_processing(False)
+        self._toolbar.apply_state(recording=False, processing=False, audio_processing=False)
+        if not self._config.stealth_enabled and self._overlay.response_text:
+            self._typer.type_to_notepad(self._overlay.response_text)
         if self._config.overlay_timeout_ms > 0:
-            QTimer.singleShot(self._config.overlay_timeout_ms, self._overlay.hide)
+            self._overlay_hide_timer.start(self._config.overlay_timeout_ms)
 
+    @pyqtSlot(str)
     def _on_streaming_error(self, error: str) -> None:
+        self._discard_chunks()
         self._is_recording = False
-        self._is_responding = False
-        self._reconnect_loopback_signals()
-        self._toolbar.set_recording_state(False)
-        self._toolbar.set_audio_processing(False)
-        self._toolbar.set_processing(False)
+        self._set_responding(False)
+        self._toolbar.apply_state(recording=False, processing=False, audio_processing=False)
         self._overlay.show_error(error)
 
-    def _on_audio_complete(self, response: str) -> None:
-        self._toolbar.set_audio_processing(False)
-        if response:
-            if self._config.stealth_enabled:
-                self._overlay.show_response(response)
-            else:
-                self._typer.type_to_notepad(response)
-
+    @pyqtSlot()
     def _on_text_input(self) -> None:
         """Handle F8 - grab clipboard text and send to AI with session context."""
         clipboard = QApplication.clipboard()
@@ -934,63 +978,57 @@ Output ONLY the commit message, nothing else."""
 
         self._last_transcript = text
 
-        messages = (
-            self._session_manager.get_messages()
-            if self._session_manager.persistent_mode
-            else None
-        )
-
-        self._is_responding = True
-        asyncio.run_coroutine_threadsafe(
-            self._stream_and_track_response(text, messages),
-            self._loop
+        self._set_responding(True)
+        self._streaming_task = self._spawn(
+            self._stream_and_track_response(text)
         )
 
+    @pyqtSlot()
     def _on_retry_hotkey(self) -> None:
         if not self._last_transcript or self._is_responding:
             return
-        self._is_responding = True
+        self._set_responding(True)
         self._overlay.clear_and_show()
         self._overlay.show_transcript(self._last_transcript)
         self._overlay.start_streaming_response()
-        messages = (
-            self._session_manager.get_messages()
-            if self._session_manager.persistent_mode
-            else None
-        )
-        asyncio.run_coroutine_threadsafe(
-            self._stream_and_track_response(self._last_transcript, messages),
-            self._loop
+        self._streaming_task = self._spawn(
+            self._stream_and_track_response(self._last_transcript)
         )
 
+    @pyqtSlot()
     def _on_cancel_response(self) -> None:
         if not self._is_responding:
             return
         if self._streaming_task:
             self._streaming_task.cancel()
-        self._is_responding = False
+        self._discard_chunks()
+        self._set_responding(False)
+        self._toolbar.apply_state(recording=False, processing=False, audio_processing=False)
         self._overlay.show_response("Cancelled - press F10 to retry")
 
+    @pyqtSlot(QAction)
+    def _on_provider_action(self, action: QAction) -> None:
+        self._on_provider_change(action.data())
+
     def _on_provider_change(self, provider_name: str) -> None:
         """Handle provider selection change from menu."""
-        if provider_name == self._active_provider_name:
+        if (
+            provider_name == self._active_provider_name
+            or provider_name not in self._provider_factories
+        ):
             return
 
-        if provider_name == self.PROVIDER_CLAUDE:
-            self._active_provider = self._claude_provider
-        elif provider_name == self.PROVIDER_GEMINI_PRO:
-            self._active_provider = self._gemini_pro_provider
-        elif provider_name == self.PROVIDER_GEMINI_FLASH:
-            self._active_provider = self._gemini_flash_provider
-
+        self._active_provider = self._get_provider(provider_name)
         self._active_provider_name = provider_name
         logger.info("AI provider changed to: %s", provider_name)
 
+    @pyqtSlot(bool)
     def _on_toggle_persistent_mode(self, checked: bool) -> None:
         self._session_manager.persistent_mode = checked
         self._update_clear_session_action()
         logger.debug("Persistent mode toggled via menu: %s", checked)
 
+    @pyqtSlot()
     def _on_clear_session(self) -> None:
         self._session_manager.clear()
         self._update_clear_session_action()
@@ -999,27 +1037,34 @@ Output ONLY the commit message, nothing else."""
     def _on_reset_click(self) -> None:
         self._session_manager.clear()
         self._pending_payloads.clear()
-        self._toolbar.set_queue_count(0)
-        self._toolbar.set_clipboard_ready(False)
+        self._toolbar.set_queue(0)
         self._update_clear_session_action()
         self._overlay.show_response("Session cleared")
 
     def _update_clear_session_action(self) -> None:
-        enabled = (
+        self._signals.clear_session_enabled.emit(
             self._session_manager.persistent_mode
             and not self._session_manager.is_empty()
         )
-        self._clear_session_action.setEnabled(enabled)
 
+    @pyqtSlot()
     def _quit(self) -> None:
+        if self._hotkey_filter is not None:
+            self._hotkey_filter.remove()
         if self._hotkey_listener is not None:
             self._hotkey_listener.stop()
         self._monitor.stop()
-        asyncio.run_coroutine_threadsafe(self._loopback.shutdown(), self._loop)
-        asyncio.run_coroutine_threadsafe(self._deepgram.stop_streaming(), self._loop)
         self._overlay.hide()
         self._toolbar.hide()
         self._tray.hide()
+        self._spawn(self._shutdown())
+
+    async def _shutdown(self) -> None:
+        await asyncio.gather(
+            self._loopback.shutdown(),
+            self._deepgram.stop_streaming(),
+            return_exceptions=True,
+        )
         self._loop.stop()
 
     def run(self) -> None:
@@ -1,6 +1,8 @@
+import functools
 import subprocess
-import time
+from typing import Callable, Iterator, Optional
 
+from PyQt6.QtCore import QTimer
 import win32api
 import win32con
 import win32gui
@@ -9,6 +11,12 @@ import win32clipboard
 
 SCI_PASTE = 2179
 
+_NOTEPAD_CLASSES = ("Notepad++", "Notepad")
+_EDIT_CLASSES = ("Scintilla", "Edit")
+# Backoff while a freshly launched editor creates its window.
+_LAUNCH_POLL_DELAYS_MS = (20, 40, 80, 160, 320, 640)
+_NEW_TAB_SETTLE_MS = 100
+
 
 class HumanTyper:
     def __init__(self, base_delay: float = 0.022, variance: float = 0.008, tab_width: int = 4):
@@ -17,26 +25,20 @@ class HumanTyper:
         self._edit_hwnd = None
 
     def _find_notepad_window(self) -> int:
-        def callback(hwnd, windows):
-            title = win32gui.GetWindowText(hwnd)
-            if "Notepad++" in title or title.endswith("Notepad"):
-                windows.append(hwnd)
-            return True
-
-        windows = []
-        win32gui.EnumWindows(callback, windows)
-        return windows[0] if windows else None
+        # Class lookups go straight to USER32 instead of calling back into
+        # Python for every top-level window.
+        for class_name in _NOTEPAD_CLASSES:
+            hwnd = win32gui.FindWindow(class_name, None)
+            if hwnd:
+                return hwnd
+        return None
 
     def _find_edit_control(self, parent_hwnd: int) -> int:
-        def callback(hwnd, controls):
-            class_name = win32gui.GetClassName(hwnd)
-            if class_name in ("Edit", "Scintilla"):
-                controls.append(hwnd)
-            return True
-
-        controls = []
-        win32gui.EnumChildWindows(parent_hwnd, callback, controls)
-        return controls[0] if controls else parent_hwnd
+        for class_name in _EDIT_CLASSES:
+            hwnd = win32gui.FindWindowEx(parent_hwnd, 0, class_name, None)
+            if hwnd:
+                return hwnd
+        return parent_hwnd
 
     def _normalize_text(self, text: str) -> str:
         text = text.replace('\t', ' ' * self._tab_width)
@@ -57,39 +59,88 @@ class HumanTyper:
         win32api.SendMessage(self._notepad_hwnd, win32con.WM_KEYUP, vk_code, 0)
         win32api.SendMessage(self._notepad_hwnd, win32con.WM_KEYUP, win32con.VK_CONTROL, 0)
 
-    def open_notepad(self):
+    def open_notepad(self, on_ready: Optional[Callable[[], None]] = None):
+        # Runs on the GUI thread, so a fresh launch is polled with QTimer
+        # rather than sleeping; on_ready fires once the window is resolved.
+        if (
+            self._notepad_hwnd
+            and win32gui.IsWindow(self._notepad_hwnd)
+            and self._edit_hwnd
+            and win32gui.IsWindow(self._edit_hwnd)
+        ):
+            if on_ready is not None:
+                on_ready()
+            return
+
+        self._notepad_hwnd = self._find_notepad_window()
+        if self._notepad_hwnd:
+            self._finish_open(on_ready)
+            return
+
+        try:
+            subprocess.Popen([r"C:\Program Files\Notepad++\notepad++.exe"])
+        except FileNotFoundError:
+            subprocess.Popen(["notepad.exe"])
+        self._schedule_window_poll(iter(_LAUNCH_POLL_DELAYS_MS), on_ready)
+
+    def _schedule_window_poll(
+        self, delays: Iterator[int], on_ready: Optional[Callable[[], None]]
+    ):
+        delay = next(delays, None)
+        if delay is None:
+            self._finish_open(on_ready)
+            return
+        QTimer.singleShot(delay, functools.partial(self._poll_notepad_window, delays, on_ready))
+
+    def _poll_notepad_window(
+        self, delays: Iterator[int], on_ready: Optional[Callable[[], None]]
+    ):
         self._notepad_hwnd = self._find_notepad_window()
-        if not self._notepad_hwnd:
-            try:
-                subprocess.Popen([r"C:\Program Files\Notepad++\notepad++.exe"])
-            except FileNotFoundError:
-                subprocess.Popen(["notepad.exe"])
-            time.sleep(0.8)
-            self._notepad_hwnd = self._find_notepad_window()
+        if self._notepad_hwnd:
+            self._finish_open(on_ready)
+        else:
+            self._schedule_window_poll(delays, on_ready)
 
+    def _finish_open(self, on_ready: Optional[Callable[[], None]]):
         if self._notepad_hwnd:
             self._edit_hwnd = self._find_edit_control(self._notepad_hwnd)
+        if on_ready is not None:
+            on_ready()
 
     def type_text(self, text: str):
         if not self._edit_hwnd:
             return
 
         text = self._normalize_text(text)
-        self._set_clipboard(text)
 
         class_name = win32gui.GetClassName(self._edit_hwnd)
+        if class_name == "Edit":
+            # Replaces the selection at the caret like a paste would; Windows
+            # marshals the string for this system message across processes.
+            # Skipping the clipboard also keeps our own ClipboardMonitor from
+            # queueing the response as a new payload.
+            win32gui.SendMessage(self._edit_hwnd, win32con.EM_REPLACESEL, True, text)
+            return
+
+        # Scintilla's text messages take a raw pointer that is not marshalled
+        # into another process, so it still goes through the clipboard.
+        self._set_clipboard(text)
         if class_name == "Scintilla":
             win32api.SendMessage(self._edit_hwnd, SCI_PASTE, 0, 0)
         else:
             win32api.SendMessage(self._edit_hwnd, win32con.WM_PASTE, 0, 0)
 
-    def new_tab(self):
+    def new_tab(self, on_ready: Optional[Callable[[], None]] = None):
         if self._notepad_hwnd:
             self._send_ctrl_key(ord('N'))
-            time.sleep(0.1)
-            self._edit_hwnd = self._find_edit_control(self._notepad_hwnd)
+            # Give the editor a moment to create the tab before re-resolving it.
+            QTimer.singleShot(_NEW_TAB_SETTLE_MS, functools.partial(self._finish_open, on_ready))
+        elif on_ready is not None:
+            on_ready()
 
     def type_to_notepad(self, text: str, delay: float = 2.0):
-        time.sleep(delay)
-        self.open_notepad()
-        self.type_text(text)
+        # Callers are on the GUI thread; wait on the event loop, not in sleep().
+        QTimer.singleShot(int(delay * 1000), functools.partial(self._paste_to_notepad, text))
+
+    def _paste_to_notepad(self, text: str):
+        self.open_notepad(functools.partial(self.type_text, text))
@@ -1,8 +1,15 @@
 """Fix encoding and clipboard utilities."""
 from __future__ import annotations
 
+import mmap
 import re
 from pathlib import Path
+from typing import Callable
+
+try:
+    from PyQt6.QtWidgets import QApplication
+except ImportError:
+    QApplication = None
 
 
 UNICODE_TO_ASCII: dict[str, str] = {
@@ -22,12 +29,17 @@ UNICODE_TO_ASCII: dict[str, str] = {
 }
 
 
+# Built once; translate() maps every character in a single pass.
+_TRANSLATE_TABLE = str.maketrans(UNICODE_TO_ASCII)
+
+_NON_ASCII_BYTE = re.compile(rb"[\x80-\xff]")
+
+
 def replace_unicode_with_ascii(text: str) -> str:
     """Replace common unicode characters with ASCII equivalents."""
-    result = text
-    for unicode_char, ascii_char in UNICODE_TO_ASCII.items():
-        result = result.replace(unicode_char, ascii_char)
-    return result
+    if text.isascii():
+        return text
+    return text.translate(_TRANSLATE_TABLE)
 
 
 def fix_file_encoding(file_path: Path) -> bool:
@@ -35,6 +47,15 @@ def fix_file_encoding(file_path: Path) -> bool:
 
     Returns True if file was modified, False otherwise.
     """
+    # Scan the mapped file first so clean ASCII files are never read into memory.
+    with file_path.open("rb") as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if _NON_ASCII_BYTE.search(mm) is None:
+                    return False
+        except ValueError:
+            # Empty files cannot be mapped and have nothing to fix.
+            return False
     content = file_path.read_text(encoding="utf-8")
     fixed_content = replace_unicode_with_ascii(content)
     if fixed_content != content:
@@ -45,11 +66,20 @@ def fix_file_encoding(file_path: Path) -> bool:
 
 def is_ascii_only(text: str) -> bool:
     """Check if text contains only ASCII characters."""
-    try:
-        text.encode("ascii")
-        return True
-    except UnicodeEncodeError:
-        return False
+    return text.isascii()
+
+
+def _get_clipboard():
+    """Return the current application's clipboard, or None without PyQt6.
+
+    Looked up per call: a cached wrapper would outlive a recreated QApplication.
+    """
+    if QApplication is None:
+        return None
+    return QApplication.clipboard()
+
+
+_last_copied: str | None = None
 
 
 def copy_text_to_clipboard(text: str) -> bool:
@@ -57,12 +87,18 @@ def copy_text_to_clipboard(text: str) -> bool:
 
     Returns True if successful, False otherwise.
     """
+    global _last_copied
     try:
-        from PyQt6.QtWidgets import QApplication
-        clipboard = QApplication.clipboard()
+        clipboard = _get_clipboard()
         if clipboard is None:
             return False
+        # Setting identical text still notifies every clipboard listener.
+        # While we own the clipboard it still holds exactly what we set, and
+        # ownsClipboard() is a local check rather than a cross-process read.
+        if text and text == _last_copied and clipboard.ownsClipboard():
+            return True
         clipboard.setText(text)
+        _last_copied = text
         return True
     except Exception:
         return False
@@ -74,10 +110,28 @@ def get_clipboard_text() -> str | None:
     Returns clipboard text or None if unavailable.
     """
     try:
-        from PyQt6.QtWidgets import QApplication
-        clipboard = QApplication.clipboard()
+        clipboard = _get_clipboard()
         if clipboard is None:
             return None
         return clipboard.text()
     except Exception:
         return None
+
+
+def subscribe_clipboard(callback: Callable[[], None]) -> bool:
+    """Call callback whenever the system clipboard changes.
+
+    Use this instead of polling get_clipboard_text() from a timer: Qt
+    forwards the OS change notification, so the callback runs on the Qt
+    thread once per actual change.
+
+    Returns True if subscribed, False if no QApplication is running.
+    """
+    try:
+        clipboard = _get_clipboard()
+        if clipboard is None:
+            return False
+        clipboard.dataChanged.connect(callback)
+        return True
+    except Exception:
+        return False